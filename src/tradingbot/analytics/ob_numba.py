@@ -0,0 +1,71 @@
+"""Order book analytics over OrderBookArrays columns, JIT-compiled with numba when available.
+
+Bids are expected best-first (descending price) and asks best-first (ascending),
+as ccxt and the CLOB return them. Kernels are written in the numpy subset numba
+supports, so the same code runs vectorised under plain numpy when numba is not
+installed (the ``jit`` extra).
+"""
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+
+    def _jit(signature: str) -> Callable[[F], F]:
+        return lambda func: func
+
+else:
+    HAS_NUMBA = True
+
+    def _jit(signature: str) -> Callable[[F], F]:
+        # An explicit signature compiles at import; cache=True persists the machine
+        # code in __pycache__ so later processes skip LLVM entirely.
+        return cast("Callable[[F], F]", njit(signature, cache=True))
+
+
+@_jit("float64(float64[:], float64[:])")
+def mid_price(bid_prices: npt.NDArray[np.float64], ask_prices: npt.NDArray[np.float64]) -> float:
+    """Midpoint of the best bid and ask; NaN if either side is empty."""
+    if bid_prices.size == 0 or ask_prices.size == 0:
+        return np.nan
+    return float((bid_prices[0] + ask_prices[0]) * 0.5)
+
+
+@_jit("float64(float64[:], float64[:])")
+def spread(bid_prices: npt.NDArray[np.float64], ask_prices: npt.NDArray[np.float64]) -> float:
+    """Best ask minus best bid; NaN if either side is empty."""
+    if bid_prices.size == 0 or ask_prices.size == 0:
+        return np.nan
+    return float(ask_prices[0] - bid_prices[0])
+
+
+@_jit("float64(float64[:], float64[:])")
+def imbalance(bid_sizes: npt.NDArray[np.float64], ask_sizes: npt.NDArray[np.float64]) -> float:
+    """(bid volume - ask volume) / total volume in [-1, 1]; NaN for an empty book."""
+    bids = float(bid_sizes.sum())
+    asks = float(ask_sizes.sum())
+    total = bids + asks
+    if total == 0.0:
+        return np.nan
+    return (bids - asks) / total
+
+
+@_jit("float64(float64[:], float64[:], float64, boolean)")
+def cumulative_volume_to_price(
+    prices: npt.NDArray[np.float64],
+    sizes: npt.NDArray[np.float64],
+    limit_price: float,
+    is_bid: bool,
+) -> float:
+    """Total size resting at or better than ``limit_price`` on one side of the book."""
+    if is_bid:
+        return float(sizes[prices >= limit_price].sum())
+    return float(sizes[prices <= limit_price].sum())
@@ -1,13 +1,19 @@
 """CLI commands for the trading bot."""
 
 import asyncio
+import importlib.util
 import logging
 import sys
+from typing import TYPE_CHECKING
 
 import click
 
-from tradingbot.config.settings import AppSettings
-from tradingbot.core.engine import TradingEngine
+from tradingbot.utils.runner import has_uvloop, run
+
+# Keep this module light: the engine pulls in ccxt, alpaca-py and
+# py-clob-client, so those are imported inside the commands that need them.
+if TYPE_CHECKING:
+    from tradingbot.config.settings import AppSettings
 
 
 def _setup_logging(level: str) -> None:
@@ -18,9 +24,26 @@ def _setup_logging(level: str) -> None:
     )
 
 
-def _run(coro):  # type: ignore[no-untyped-def]
-    """Run an async coroutine in a new event loop."""
-    return asyncio.run(coro)
+def _has_httptools() -> bool:
+    return importlib.util.find_spec("httptools") is not None
+
+
+def _make_settings() -> "AppSettings":
+    from tradingbot.config.settings import get_settings
+
+    return get_settings()
+
+
+def _get_settings(ctx: click.Context) -> "AppSettings":
+    """Build the settings on first use and configure logging from them."""
+    settings: AppSettings | None = ctx.obj.get("settings")
+    if settings is None:
+        settings = ctx.obj["settings_factory"]()
+        if ctx.obj["log_level"]:
+            settings = settings.model_copy(update={"log_level": ctx.obj["log_level"]})
+        _setup_logging(settings.log_level)
+        ctx.obj["settings"] = settings
+    return settings
 
 
 @click.group()
@@ -29,11 +52,8 @@ def _run(coro):  # type: ignore[no-untyped-def]
 def cli(ctx: click.Context, log_level: str | None) -> None:
     """Multi-exchange trading bot for crypto, stocks, and prediction markets."""
     ctx.ensure_object(dict)
-    settings = AppSettings()
-    if log_level:
-        settings.log_level = log_level
-    _setup_logging(settings.log_level)
-    ctx.obj["settings"] = settings
+    ctx.obj["log_level"] = log_level
+    ctx.obj["settings_factory"] = _make_settings
 
 
 @cli.command()
@@ -41,9 +61,11 @@ def cli(ctx: click.Context, log_level: str | None) -> None:
 @click.pass_context
 def start(ctx: click.Context, web: bool) -> None:
     """Start the trading engine."""
-    settings: AppSettings = ctx.obj["settings"]
+    settings = _get_settings(ctx)
 
     async def _start() -> None:
+        from tradingbot.core.engine import TradingEngine
+
         engine = TradingEngine(settings)
         await engine.initialize()
 
@@ -58,6 +80,10 @@ def start(ctx: click.Context, web: bool) -> None:
                 host=settings.web_host,
                 port=settings.web_port,
                 log_level=settings.log_level.lower(),
+                loop="uvloop" if has_uvloop() else "auto",
+                http="httptools" if _has_httptools() else "auto",
+                interface="asgi3",
+                access_log=settings.log_level.upper() == "DEBUG",
             )
             server = uvicorn.Server(config)
 
@@ -78,77 +104,85 @@ def start(ctx: click.Context, web: bool) -> None:
             finally:
                 await engine.stop()
 
-    _run(_start())
+    run(_start())
 
 
 @cli.command()
 @click.pass_context
 def balance(ctx: click.Context) -> None:
     """Show balances across all connected exchanges."""
-    settings: AppSettings = ctx.obj["settings"]
+    settings = _get_settings(ctx)
 
     async def _balance() -> None:
-        engine = TradingEngine(settings)
-        await engine.initialize()
+        from tradingbot.core.engine import engine_context
 
-        if not engine.connectors:
-            click.echo("No connectors available. Check your API keys in .env")
-            return
+        async with engine_context(settings) as engine:
+            if not engine.connectors:
+                click.echo("No connectors available. Check your API keys in .env")
+                return
 
-        balances = await engine.get_all_balances()
-        for exchange, items in balances.items():
-            click.echo(f"\n{'─' * 40}")
-            click.echo(f"  {exchange.upper()}")
-            click.echo(f"{'─' * 40}")
-            if not items:
-                click.echo("  No balances")
-            for b in items:
-                click.echo(f"  {b.currency:>8}  free={b.free:<14}  used={b.used:<14}  total={b.total}")
+            balances = await engine.get_all_balances()
+            for exchange, items in balances.items():
+                click.echo(f"\n{'─' * 40}")
+                click.echo(f"  {exchange.upper()}")
+                click.echo(f"{'─' * 40}")
+                if not items:
+                    click.echo("  No balances")
+                for b in items:
+                    click.echo(f"  {b.currency:>8}  free={b.free:<14}  used={b.used:<14}  total={b.total}")
 
-        for connector in engine.connectors.values():
-            await connector.close()
-
-    _run(_balance())
+    run(_balance())
 
 
 @cli.command()
 @click.pass_context
 def positions(ctx: click.Context) -> None:
     """Show open positions across all connected exchanges."""
-    settings: AppSettings = ctx.obj["settings"]
+    settings = _get_settings(ctx)
 
     async def _positions() -> None:
-        engine = TradingEngine(settings)
-        await engine.initialize()
-
-        if not engine.connectors:
-            click.echo("No connectors available. Check your API keys in .env")
-            return
-
-        all_positions = await engine.get_all_positions()
-        for exchange, items in all_positions.items():
-            click.echo(f"\n{'─' * 50}")
-            click.echo(f"  {exchange.upper()}")
-            click.echo(f"{'─' * 50}")
-            if not items:
-                click.echo("  No open positions")
-            for p in items:
-                click.echo(
-                    f"  {p.symbol:>12}  {p.side.value:>4}  qty={p.quantity:<10}  "
-                    f"entry={p.entry_price:<12}  pnl={p.unrealized_pnl}"
-                )
-
-        for connector in engine.connectors.values():
-            await connector.close()
-
-    _run(_positions())
+        from tradingbot.core.engine import engine_context
+
+        async with engine_context(settings) as engine:
+            if not engine.connectors:
+                click.echo("No connectors available. Check your API keys in .env")
+                return
+
+            all_positions = await engine.get_all_positions()
+            for exchange, items in all_positions.items():
+                click.echo(f"\n{'─' * 50}")
+                click.echo(f"  {exchange.upper()}")
+                click.echo(f"{'─' * 50}")
+                if not items:
+                    click.echo("  No open positions")
+                for p in items:
+                    click.echo(
+                        f"  {p.symbol:>12}  {p.side.value:>4}  qty={p.quantity:<10}  "
+                        f"entry={p.entry_price:<12}  pnl={p.unrealized_pnl}"
+                    )
+
+    run(_positions())
+
+
+def _connector_info(settings: "AppSettings", name: str) -> str:
+    """Describe one connector's configuration, touching only its own sub-settings."""
+    if name == "ccxt":
+        ccxt = settings.ccxt
+        return f"{ccxt.exchange} (testnet={ccxt.testnet})" if ccxt.api_key else "not configured"
+    if name == "alpaca":
+        alpaca = settings.alpaca
+        return f"paper={alpaca.paper}" if alpaca.api_key else "not configured"
+    if name == "polymarket":
+        polymarket = settings.polymarket
+        return f"chain_id={polymarket.chain_id}" if polymarket.private_key else "not configured"
+    return "unknown"
 
 
 @cli.command()
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show bot configuration and connector status."""
-    settings: AppSettings = ctx.obj["settings"]
+    settings = _get_settings(ctx)
 
     click.echo(f"\n{'═' * 40}")
     click.echo("  Trading Bot Status")
@@ -159,18 +193,8 @@ def status(ctx: click.Context) -> None:
     click.echo(f"  Web dashboard:      {settings.web_host}:{settings.web_port}")
     click.echo()
 
-    connectors_info = {
-        "ccxt": f"{settings.ccxt.exchange} (testnet={settings.ccxt.testnet})"
-        if settings.ccxt.api_key
-        else "not configured",
-        "alpaca": f"paper={settings.alpaca.paper}" if settings.alpaca.api_key else "not configured",
-        "polymarket": f"chain_id={settings.polymarket.chain_id}"
-        if settings.polymarket.private_key
-        else "not configured",
-    }
-
     for name in settings.enabled_connectors:
-        info = connectors_info.get(name, "unknown")
+        info = _connector_info(settings, name)
         configured = "not configured" not in info
         marker = "+" if configured else "-"
         click.echo(f"  [{marker}] {name}: {info}")
@@ -187,39 +211,35 @@ def status(ctx: click.Context) -> None:
 @click.pass_context
 def trade(ctx: click.Context, symbol: str, side: str, qty: float, price: float | None, exchange: str | None) -> None:
     """Place a manual trade."""
-    settings: AppSettings = ctx.obj["settings"]
+    settings = _get_settings(ctx)
 
     async def _trade() -> None:
+        from tradingbot.core.engine import engine_context
         from tradingbot.core.models import OrderSide, OrderType
 
-        engine = TradingEngine(settings)
-        await engine.initialize()
+        async with engine_context(settings) as engine:
+            if not engine.connectors:
+                click.echo("No connectors available. Check your API keys in .env")
+                return
+
+            target = exchange or next(iter(engine.connectors))
+            connector = engine.connectors.get(target)
+            if connector is None:
+                click.echo(f"Connector '{target}' not found. Available: {list(engine.connectors.keys())}")
+                return
+
+            order_side = OrderSide.BUY if side == "buy" else OrderSide.SELL
+            order_type = OrderType.LIMIT if price else OrderType.MARKET
+
+            click.echo(f"Placing {order_type.value} {side} order: {qty} {symbol} on {target}")
+            if settings.dry_run:
+                click.echo("[DRY RUN] Order not submitted. Set dry_run=false in config to execute.")
+                return
+
+            try:
+                order = await connector.place_order(symbol, order_side, order_type, qty, price)
+                click.echo(f"Order placed: id={order.order_id} status={order.status.value}")
+            except Exception as e:
+                click.echo(f"Order failed: {e}")
 
-        if not engine.connectors:
-            click.echo("No connectors available. Check your API keys in .env")
-            return
-
-        target = exchange or next(iter(engine.connectors))
-        connector = engine.connectors.get(target)
-        if connector is None:
-            click.echo(f"Connector '{target}' not found. Available: {list(engine.connectors.keys())}")
-            return
-
-        order_side = OrderSide.BUY if side == "buy" else OrderSide.SELL
-        order_type = OrderType.LIMIT if price else OrderType.MARKET
-
-        click.echo(f"Placing {order_type.value} {side} order: {qty} {symbol} on {target}")
-        if settings.dry_run:
-            click.echo("[DRY RUN] Order not submitted. Set dry_run=false in config to execute.")
-            return
-
-        try:
-            order = await connector.place_order(symbol, order_side, order_type, qty, price)
-            click.echo(f"Order placed: id={order.order_id} status={order.status.value}")
-        except Exception as e:
-            click.echo(f"Order failed: {e}")
-        finally:
-            for c in engine.connectors.values():
-                await c.close()
-
-    _run(_trade())
+    run(_trade())
@@ -1,6 +1,9 @@
 """TOML configuration file loader with deep merge support."""
 
+import copy
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -9,28 +12,85 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
+# Parsed TOML files keyed by resolved path, stored with the (mtime, size) they were
+# read at. Size catches rewrites within one mtime tick on coarse-grained filesystems.
+_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Recursively merge override into base, returning a new dict."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    """Deep-merge override into base, returning a new dict; neither input is mutated."""
+    if not any(isinstance(value, dict) for value in override.values()):
+        # Flat override (the usual env-style overlay): every key is a plain
+        # replacement, so only the base values it leaves in place need copying.
+        merged = {k: override[k] if k in override else copy.deepcopy(v) for k, v in base.items()}
+        merged.update(override)
+        return merged
+    return _merge_into(copy.deepcopy(base), override)
+
+
+def _merge_into(target: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Merge override into target in place, without recursion, and return target."""
+    stack = [(target, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
+    return target
 
 
 def load_toml(path: Path) -> dict[str, Any]:
-    """Load a single TOML file."""
-    with open(path, "rb") as f:
-        return tomllib.load(f)
+    """Load a single TOML file.
+
+    Parsed files are cached until their mtime or size changes. Callers get a deep
+    copy, so mutating the result never affects the cache.
+    """
+    path = path.resolve()
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, tomllib.loads(path.read_bytes().decode("utf-8")))
+        _CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _listed_names(paths: tuple[Path, ...]) -> dict[Path, set[str]]:
+    """List each directory holding two or more candidate paths with a single scandir.
+
+    Directories with one candidate are left out: trying to load that file directly
+    costs fewer syscalls than listing its directory.
+    """
+    listed: dict[Path, set[str]] = {}
+    for directory, count in Counter(p.parent for p in paths).items():
+        if count < 2:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                listed[directory] = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            listed[directory] = set()
+    return listed
 
 
 def load_config(*paths: Path) -> dict[str, Any]:
-    """Load and merge multiple TOML config files. Later files override earlier ones."""
+    """Load and merge multiple TOML config files. Later files override earlier ones.
+
+    Missing files are skipped.
+    """
+    listed = _listed_names(paths)
     config: dict[str, Any] = {}
     for path in paths:
-        if path.exists():
-            config = deep_merge(config, load_toml(path))
+        names = listed.get(path.parent)
+        if names is not None and path.name not in names:
+            continue
+        # EAFP: load_toml stats the file anyway, so a separate exists() check is a wasted syscall
+        try:
+            data = load_toml(path)
+        except FileNotFoundError:
+            continue
+        _merge_into(config, data)
     return config
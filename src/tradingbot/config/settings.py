@@ -1,20 +1,26 @@
 """Application settings loaded from environment variables."""
 
+import re
+from functools import lru_cache
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
+_CONNECTOR_SPLITTER = re.compile(r"\s*,\s*")
+
 
 class CCXTSettings(BaseSettings):
-    model_config = {"env_prefix": "CCXT_"}
+    model_config = {"env_prefix": "CCXT_", "frozen": True}
 
     exchange: str = "binance"
     api_key: str = ""
     api_secret: str = ""
     testnet: bool = True
+    include_raw: bool = False
 
 
 class AlpacaSettings(BaseSettings):
-    model_config = {"env_prefix": "ALPACA_"}
+    model_config = {"env_prefix": "ALPACA_", "frozen": True}
 
     api_key: str = ""
     api_secret: str = ""
@@ -22,7 +28,7 @@ class AlpacaSettings(BaseSettings):
 
 
 class PolymarketSettings(BaseSettings):
-    model_config = {"env_prefix": "POLYMARKET_"}
+    model_config = {"env_prefix": "POLYMARKET_", "frozen": True}
 
     private_key: str = ""
     chain_id: int = 137
@@ -30,7 +36,7 @@ class PolymarketSettings(BaseSettings):
 
 
 class AppSettings(BaseSettings):
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
+    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "frozen": True}
 
     log_level: str = "INFO"
     enabled_connectors: list[str] = Field(default=["ccxt", "alpaca", "polymarket"])
@@ -38,9 +44,9 @@ class AppSettings(BaseSettings):
     @field_validator("enabled_connectors", mode="before")
     @classmethod
     def parse_connectors(cls, v: object) -> object:
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",") if s.strip()]
-        return v
+        if not isinstance(v, str):
+            return v
+        return [name for name in _CONNECTOR_SPLITTER.split(v.strip()) if name]
 
     web_host: str = "127.0.0.1"
     web_port: int = 8000
@@ -49,3 +55,9 @@ class AppSettings(BaseSettings):
     ccxt: CCXTSettings = Field(default_factory=CCXTSettings)
     alpaca: AlpacaSettings = Field(default_factory=AlpacaSettings)
     polymarket: PolymarketSettings = Field(default_factory=PolymarketSettings)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the process-wide settings, reading the environment and .env only once."""
+    return AppSettings()
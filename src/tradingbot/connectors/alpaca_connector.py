@@ -1,16 +1,20 @@
 """Alpaca connector for stock trading (sync client wrapped as async)."""
 
 import logging
-from decimal import Decimal
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, TypeVar
 
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import OrderSide as AlpacaOrderSide
-from alpaca.trading.enums import OrderStatus as AlpacaOrderStatus
 from alpaca.trading.enums import TimeInForce
 from alpaca.trading.requests import LimitOrderRequest, MarketOrderRequest
 
 from tradingbot.core.exceptions import ConnectorError, OrderError
 from tradingbot.core.models import (
+    ORDER_SIDE_BY_VALUE,
+    ORDER_TYPE_BY_VALUE,
     Balance,
     Market,
     Order,
@@ -22,9 +26,12 @@ from tradingbot.core.models import (
     Ticker,
 )
 from tradingbot.utils.async_helpers import run_in_executor
+from tradingbot.utils.decimal_helpers import to_decimal
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 _ALPACA_STATUS_MAP: dict[str, OrderStatus] = {
     "new": OrderStatus.OPEN,
     "accepted": OrderStatus.OPEN,
@@ -38,6 +45,18 @@ _ALPACA_STATUS_MAP: dict[str, OrderStatus] = {
     "replaced": OrderStatus.CANCELLED,
 }
 
+_ALPACA_SIDE_MAP: dict[OrderSide, AlpacaOrderSide] = {
+    OrderSide.BUY: AlpacaOrderSide.BUY,
+    OrderSide.SELL: AlpacaOrderSide.SELL,
+}
+
+
+def _enum_value(value: object, default: str) -> str:
+    """Lowercase value of an alpaca enum field (str() on those yields 'OrderSide.BUY')."""
+    if value is None:
+        return default
+    return (value.value if isinstance(value, Enum) else str(value)).lower()
+
 
 class AlpacaConnector:
     """Connector for Alpaca stock trading API."""
@@ -54,6 +73,7 @@ class AlpacaConnector:
         self._api_secret = api_secret
         self._paper = paper
         self._client: TradingClient | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def client(self) -> TradingClient:
@@ -61,43 +81,53 @@ class AlpacaConnector:
             raise ConnectorError(self.name, "Connector not initialized. Call initialize() first.")
         return self._client
 
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking TradingClient call on this connector's own thread pool."""
+        return await run_in_executor(func, *args, executor=self._executor, **kwargs)
+
     async def initialize(self) -> None:
+        # A dedicated pool keeps slow Alpaca requests from starving the shared
+        # executor used by the other sync-wrapped connectors.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="alpaca")
         try:
-            self._client = await run_in_executor(
+            self._client = await self._call(
                 TradingClient, self._api_key, self._api_secret, paper=self._paper
             )
             logger.info("Alpaca connector initialized (paper=%s)", self._paper)
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to initialize: {e}") from e
+            raise ConnectorError(self.name, "Failed to initialize: %s", e) from e
 
     async def get_balance(self) -> list[Balance]:
         try:
-            account = await run_in_executor(self.client.get_account)
+            account = await self._call(self.client.get_account)
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch account: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch account: %s", e) from e
 
+        cash = to_decimal(account.cash)
+        portfolio_value = to_decimal(account.portfolio_value)
         return [
             Balance(
                 currency="USD",
-                free=Decimal(str(account.cash)),
-                used=Decimal(str(account.portfolio_value)) - Decimal(str(account.cash)),
-                total=Decimal(str(account.portfolio_value)),
+                free=cash,
+                used=portfolio_value - cash,
+                total=portfolio_value,
             )
         ]
 
     async def get_positions(self) -> list[Position]:
         try:
-            positions = await run_in_executor(self.client.get_all_positions)
+            positions = await self._call(self.client.get_all_positions)
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch positions: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch positions: %s", e) from e
 
         return [
             Position(
                 symbol=p.symbol,
-                quantity=Decimal(str(abs(float(p.qty)))),
-                entry_price=Decimal(str(p.avg_entry_price)),
-                current_price=Decimal(str(p.current_price)),
-                unrealized_pnl=Decimal(str(p.unrealized_pl)),
+                quantity=abs(to_decimal(p.qty)),
+                entry_price=to_decimal(p.avg_entry_price),
+                current_price=to_decimal(p.current_price),
+                unrealized_pnl=to_decimal(p.unrealized_pl),
                 side=OrderSide.BUY if p.side == "long" else OrderSide.SELL,
                 connector_name=self.name,
             )
@@ -125,7 +155,7 @@ class AlpacaConnector:
         quantity: float | str,
         price: float | str | None = None,
     ) -> Order:
-        alpaca_side = AlpacaOrderSide.BUY if side == OrderSide.BUY else AlpacaOrderSide.SELL
+        alpaca_side = _ALPACA_SIDE_MAP[side]
 
         try:
             if order_type == OrderType.LIMIT:
@@ -146,54 +176,52 @@ class AlpacaConnector:
                     time_in_force=TimeInForce.DAY,
                 )
 
-            result = await run_in_executor(self.client.submit_order, request)
+            result = await self._call(self.client.submit_order, request)
         except OrderError:
             raise
         except Exception as e:
-            raise OrderError(f"Failed to place order on {self.name}: {e}") from e
+            raise OrderError("Failed to place order on %s: %s", self.name, e) from e
 
         return self._map_order(result)
 
     async def cancel_order(self, order_id: str, symbol: str | None = None) -> bool:
         try:
-            await run_in_executor(self.client.cancel_order_by_id, order_id)
+            await self._call(self.client.cancel_order_by_id, order_id)
             return True
         except Exception as e:
-            raise OrderError(f"Failed to cancel order {order_id}: {e}", order_id=order_id) from e
+            raise OrderError("Failed to cancel order %s: %s", order_id, e, order_id=order_id) from e
 
     async def get_order(self, order_id: str, symbol: str | None = None) -> Order:
         try:
-            result = await run_in_executor(self.client.get_order_by_id, order_id)
+            result = await self._call(self.client.get_order_by_id, order_id)
         except Exception as e:
-            raise OrderError(f"Failed to fetch order {order_id}: {e}", order_id=order_id) from e
+            raise OrderError("Failed to fetch order %s: %s", order_id, e, order_id=order_id) from e
         return self._map_order(result)
 
     async def get_order_history(self, symbol: str | None = None) -> list[Order]:
         try:
-            orders = await run_in_executor(self.client.get_orders)
+            orders = await self._call(self.client.get_orders)
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch order history: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch order history: %s", e) from e
         return [self._map_order(o) for o in orders]
 
     async def close(self) -> None:
         self._client = None
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
         logger.info("Alpaca connector closed")
 
     def _map_order(self, order: object) -> Order:
-        status_str = str(getattr(order, "status", "new")).lower()
-        # Handle AlpacaOrderStatus enum
-        if isinstance(order, object) and hasattr(order, "status"):
-            if isinstance(order.status, AlpacaOrderStatus):
-                status_str = order.status.value
-
+        status_str = _enum_value(getattr(order, "status", None), "new")
         return Order(
-            order_id=str(order.id),  # type: ignore[union-attr]
-            symbol=str(order.symbol),  # type: ignore[union-attr]
-            side=OrderSide.BUY if str(order.side).lower() == "buy" else OrderSide.SELL,  # type: ignore[union-attr]
-            type=OrderType.LIMIT if str(order.type).lower() == "limit" else OrderType.MARKET,  # type: ignore[union-attr]
-            quantity=Decimal(str(order.qty)),  # type: ignore[union-attr]
-            price=Decimal(str(order.limit_price)) if getattr(order, "limit_price", None) else None,  # type: ignore[union-attr]
-            filled_quantity=Decimal(str(order.filled_qty or 0)),  # type: ignore[union-attr]
+            order_id=str(order.id),  # type: ignore[attr-defined]
+            symbol=str(order.symbol),  # type: ignore[attr-defined]
+            side=ORDER_SIDE_BY_VALUE.get(_enum_value(order.side, "buy"), OrderSide.SELL),  # type: ignore[attr-defined]
+            type=ORDER_TYPE_BY_VALUE.get(_enum_value(order.type, "market"), OrderType.MARKET),  # type: ignore[attr-defined]
+            quantity=to_decimal(order.qty),  # type: ignore[attr-defined]
+            price=to_decimal(order.limit_price) if getattr(order, "limit_price", None) else None,  # type: ignore[attr-defined]
+            filled_quantity=to_decimal(order.filled_qty),  # type: ignore[attr-defined]
             status=_ALPACA_STATUS_MAP.get(status_str, OrderStatus.OPEN),
             connector_name=self.name,
         )
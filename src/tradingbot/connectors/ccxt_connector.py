@@ -1,23 +1,38 @@
 """CCXT connector for cryptocurrency exchanges (native async)."""
 
+import importlib
 import logging
+from datetime import UTC, datetime
 from decimal import Decimal
+from functools import cache, lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-import ccxt.async_support as ccxt_async
+from pydantic_core import from_json
 
 from tradingbot.core.exceptions import ConnectorError, OrderError
 from tradingbot.core.models import (
+    ORDER_SIDE_BY_VALUE,
+    ORDER_TYPE_BY_VALUE,
     Balance,
     Market,
+    MarketRow,
     Order,
     OrderBook,
+    OrderBookArrays,
     OrderBookEntry,
     OrderSide,
     OrderStatus,
     OrderType,
     Position,
     Ticker,
+    construct_trusted,
 )
+from tradingbot.utils.decimal_helpers import to_decimal
+
+if TYPE_CHECKING:
+    import aiohttp
+    import ccxt.async_support as ccxt_async
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +46,58 @@ _CCXT_STATUS_MAP: dict[str, OrderStatus] = {
 }
 
 
+def _resolve_status(status_str: str, filled: Decimal, amount: Decimal) -> OrderStatus:
+    """Map a ccxt status to OrderStatus, detecting partial fills on open orders."""
+    if status_str == "open" and 0 < filled < amount:
+        return OrderStatus.PARTIALLY_FILLED
+    return _CCXT_STATUS_MAP.get(status_str, OrderStatus.OPEN)
+
+
+@lru_cache(maxsize=256)
+def _amount_digits(value: Any, tick_size: bool) -> int:
+    """Decimal places for a ccxt ``precision.amount`` value.
+
+    Exchanges in TICK_SIZE mode (binance, kraken, okx, ...) report the step
+    itself, e.g. 1e-05, which maps to 5; DECIMAL_PLACES mode reports the count.
+    Listings repeat a handful of steps, so results are cached.
+    """
+    if not value:
+        return 8
+    if not tick_size:
+        return int(value)
+    exponent = to_decimal(value).normalize().as_tuple().exponent
+    return max(0, -exponent) if isinstance(exponent, int) else 8
+
+
+def _map_market(symbol: str, m: dict[str, Any], tick_size: bool) -> Market:
+    get = m.get
+    return Market(
+        symbol=symbol,
+        base_currency=get("base", ""),
+        quote_currency=get("quote", ""),
+        min_order_size=to_decimal(get("limits", {}).get("amount", {}).get("min")),
+        precision=_amount_digits(get("precision", {}).get("amount"), tick_size),
+        active=get("active") is not False,
+    )
+
+
+def _ccxt() -> ModuleType:
+    """Return ccxt.async_support, importing it on first use.
+
+    The import loads every exchange module (hundreds of ms), so it is deferred
+    until a connector is initialized. ``except _ccxt().BaseError`` clauses only
+    evaluate the call when an exception is actually raised.
+    """
+    return importlib.import_module("ccxt.async_support")
+
+
+@cache
+def _exchange_ids() -> frozenset[str]:
+    # Exchange ids ccxt ships; also rejects module attributes that are not exchanges
+    # (e.g. "Exchange" or "exchanges"), which a bare getattr probe would accept.
+    return frozenset(_ccxt().exchanges)
+
+
 class CCXTConnector:
     """Connector for crypto exchanges via the ccxt async API."""
 
@@ -42,28 +109,38 @@ class CCXTConnector:
         api_key: str = "",
         api_secret: str = "",
         testnet: bool = True,
+        include_raw: bool = False,
+        session: "aiohttp.ClientSession | None" = None,
     ) -> None:
         self._exchange_id = exchange_id
         self._api_key = api_key
         self._api_secret = api_secret
         self._testnet = testnet
+        # Keeping the raw ccxt dict on every Order roughly doubles its memory,
+        # so it is only attached when asked for (useful when debugging).
+        self._include_raw = include_raw
+        # ccxt treats a supplied session as borrowed and never closes it, so the
+        # owner (e.g. the engine's shared session) keeps its warm connections.
+        self._session = session
         self._exchange: ccxt_async.Exchange | None = None
 
     @property
-    def exchange(self) -> ccxt_async.Exchange:
+    def exchange(self) -> "ccxt_async.Exchange":
         if self._exchange is None:
             raise ConnectorError(self.name, "Connector not initialized. Call initialize() first.")
         return self._exchange
 
     async def initialize(self) -> None:
-        exchange_class = getattr(ccxt_async, self._exchange_id, None)
-        if exchange_class is None:
-            raise ConnectorError(self.name, f"Unknown exchange: {self._exchange_id}")
+        if self._exchange_id not in _exchange_ids():
+            raise ConnectorError(self.name, "Unknown exchange: %s", self._exchange_id)
+        exchange_class = getattr(_ccxt(), self._exchange_id)
 
         config: dict = {"enableRateLimit": True}
         if self._api_key:
             config["apiKey"] = self._api_key
             config["secret"] = self._api_secret
+        if self._session is not None:
+            config["session"] = self._session
 
         self._exchange = exchange_class(config)
 
@@ -73,48 +150,46 @@ class CCXTConnector:
         try:
             await self._exchange.load_markets()
             logger.info("CCXT connector initialized: %s (testnet=%s)", self._exchange_id, self._testnet)
-        except ccxt_async.BaseError as e:
-            raise ConnectorError(self.name, f"Failed to load markets: {e}") from e
+        except _ccxt().BaseError as e:
+            raise ConnectorError(self.name, "Failed to load markets: %s", e) from e
 
     async def get_balance(self) -> list[Balance]:
         try:
             data = await self.exchange.fetch_balance()
-        except ccxt_async.BaseError as e:
-            raise ConnectorError(self.name, f"Failed to fetch balance: {e}") from e
-
-        balances: list[Balance] = []
-        for currency, info in data.get("total", {}).items():
-            if info and float(info) > 0:
-                free = data.get("free", {}).get(currency, 0)
-                used = data.get("used", {}).get(currency, 0)
-                balances.append(
-                    Balance(
-                        currency=currency,
-                        free=Decimal(str(free or 0)),
-                        used=Decimal(str(used or 0)),
-                        total=Decimal(str(info)),
-                    )
-                )
-        return balances
+        except _ccxt().BaseError as e:
+            raise ConnectorError(self.name, "Failed to fetch balance: %s", e) from e
+
+        free_get = (data.get("free") or {}).get
+        used_get = (data.get("used") or {}).get
+        return [
+            Balance(
+                currency=currency,
+                free=to_decimal(free_get(currency)),
+                used=to_decimal(used_get(currency)),
+                total=total,
+            )
+            for currency, info in (data.get("total") or {}).items()
+            if info and (total := to_decimal(info)) > 0
+        ]
 
     async def get_positions(self) -> list[Position]:
         try:
             positions_data = await self.exchange.fetch_positions()
-        except (ccxt_async.BaseError, NotImplementedError):
+        except (_ccxt().BaseError, NotImplementedError):
             return []
 
         positions: list[Position] = []
         for p in positions_data:
-            contracts = float(p.get("contracts", 0) or 0)
-            if contracts == 0:
+            contracts = to_decimal(p.get("contracts"))
+            if not contracts:
                 continue
             positions.append(
                 Position(
                     symbol=p["symbol"],
-                    quantity=Decimal(str(abs(contracts))),
-                    entry_price=Decimal(str(p.get("entryPrice", 0) or 0)),
-                    current_price=Decimal(str(p.get("markPrice", 0) or 0)),
-                    unrealized_pnl=Decimal(str(p.get("unrealizedPnl", 0) or 0)),
+                    quantity=abs(contracts),
+                    entry_price=to_decimal(p.get("entryPrice")),
+                    current_price=to_decimal(p.get("markPrice")),
+                    unrealized_pnl=to_decimal(p.get("unrealizedPnl")),
                     side=OrderSide.BUY if p.get("side") == "long" else OrderSide.SELL,
                     connector_name=self.name,
                 )
@@ -122,46 +197,73 @@ class CCXTConnector:
         return positions
 
     async def get_markets(self) -> list[Market]:
-        markets: list[Market] = []
-        for symbol, m in self.exchange.markets.items():
-            markets.append(
-                Market(
-                    symbol=symbol,
-                    base_currency=m.get("base", ""),
-                    quote_currency=m.get("quote", ""),
-                    min_order_size=Decimal(str(m.get("limits", {}).get("amount", {}).get("min", 0) or 0)),
-                    precision=m.get("precision", {}).get("amount", 8) or 8,
-                    active=m.get("active", True),
-                )
+        # Exchanges list thousands of markets; build Markets in one pass straight
+        # from the loaded dicts rather than via MarketRow plus a validating copy.
+        tick_size = self._tick_size()
+        return [_map_market(symbol, m, tick_size) for symbol, m in self.exchange.markets.items()]
+
+    async def get_market_rows(self) -> list[MarketRow]:
+        """List markets as lightweight MarketRow records, skipping pydantic validation."""
+        tick_size = self._tick_size()
+        return [
+            MarketRow(
+                symbol=symbol,
+                base_currency=m.get("base", ""),
+                quote_currency=m.get("quote", ""),
+                min_order_size=to_decimal(m.get("limits", {}).get("amount", {}).get("min")),
+                precision=_amount_digits(m.get("precision", {}).get("amount"), tick_size),
+                active=m.get("active") is not False,
             )
-        return markets
+            for symbol, m in self.exchange.markets.items()
+        ]
+
+    def _tick_size(self) -> bool:
+        return bool(self.exchange.precisionMode == _ccxt().TICK_SIZE)
 
     async def get_ticker(self, symbol: str) -> Ticker:
         try:
             data = await self.exchange.fetch_ticker(symbol)
-        except ccxt_async.BaseError as e:
-            raise ConnectorError(self.name, f"Failed to fetch ticker for {symbol}: {e}") from e
+        except _ccxt().BaseError as e:
+            raise ConnectorError(self.name, "Failed to fetch ticker for %s: %s", symbol, e) from e
 
         return Ticker(
             symbol=symbol,
-            bid=Decimal(str(data["bid"])) if data.get("bid") else None,
-            ask=Decimal(str(data["ask"])) if data.get("ask") else None,
-            last=Decimal(str(data["last"])) if data.get("last") else None,
-            volume_24h=Decimal(str(data["quoteVolume"])) if data.get("quoteVolume") else None,
+            bid=to_decimal(data["bid"]) if data.get("bid") else None,
+            ask=to_decimal(data["ask"]) if data.get("ask") else None,
+            last=to_decimal(data["last"]) if data.get("last") else None,
+            volume_24h=to_decimal(data["quoteVolume"]) if data.get("quoteVolume") else None,
         )
 
     async def get_orderbook(self, symbol: str) -> OrderBook:
         try:
             data = await self.exchange.fetch_order_book(symbol)
-        except ccxt_async.BaseError as e:
-            raise ConnectorError(self.name, f"Failed to fetch order book for {symbol}: {e}") from e
-
-        return OrderBook(
+        except _ccxt().BaseError as e:
+            raise ConnectorError(
+                self.name, "Failed to fetch order book for %s: %s", symbol, e
+            ) from e
+
+        # Levels are already numeric, so skip validation: on deep books building
+        # thousands of validated models dominated the call.
+        entry = OrderBookEntry
+        return OrderBook.model_construct(
             symbol=symbol,
-            bids=[OrderBookEntry(price=Decimal(str(p)), quantity=Decimal(str(q))) for p, q in data.get("bids", [])],
-            asks=[OrderBookEntry(price=Decimal(str(p)), quantity=Decimal(str(q))) for p, q in data.get("asks", [])],
+            bids=[entry(price=to_decimal(p), quantity=to_decimal(q)) for p, q, *_ in data.get("bids", [])],
+            asks=[entry(price=to_decimal(p), quantity=to_decimal(q)) for p, q, *_ in data.get("asks", [])],
         )
 
+    async def get_orderbook_arrays(self, symbol: str) -> OrderBookArrays:
+        """Fetch the book straight into float64 columns, without per-level objects.
+
+        Requires the ``analytics`` extra (numpy).
+        """
+        try:
+            data = await self.exchange.fetch_order_book(symbol)
+        except _ccxt().BaseError as e:
+            raise ConnectorError(
+                self.name, "Failed to fetch order book for %s: %s", symbol, e
+            ) from e
+        return OrderBookArrays.from_levels(symbol, data.get("bids", []), data.get("asks", []))
+
     async def place_order(
         self,
         symbol: str,
@@ -178,8 +280,8 @@ class CCXTConnector:
                 amount=float(quantity),
                 price=float(price) if price is not None else None,
             )
-        except ccxt_async.BaseError as e:
-            raise OrderError(f"Failed to place order on {self.name}: {e}") from e
+        except _ccxt().BaseError as e:
+            raise OrderError("Failed to place order on %s: %s", self.name, e) from e
 
         return self._map_order(result)
 
@@ -187,48 +289,67 @@ class CCXTConnector:
         try:
             await self.exchange.cancel_order(order_id, symbol)
             return True
-        except ccxt_async.BaseError as e:
-            raise OrderError(f"Failed to cancel order {order_id}: {e}", order_id=order_id) from e
+        except _ccxt().BaseError as e:
+            raise OrderError("Failed to cancel order %s: %s", order_id, e, order_id=order_id) from e
 
     async def get_order(self, order_id: str, symbol: str | None = None) -> Order:
         try:
             result = await self.exchange.fetch_order(order_id, symbol)
-        except ccxt_async.BaseError as e:
-            raise OrderError(f"Failed to fetch order {order_id}: {e}", order_id=order_id) from e
+        except _ccxt().BaseError as e:
+            raise OrderError("Failed to fetch order %s: %s", order_id, e, order_id=order_id) from e
         return self._map_order(result)
 
     async def get_order_history(self, symbol: str | None = None) -> list[Order]:
         try:
             orders = await self.exchange.fetch_orders(symbol)
-        except ccxt_async.BaseError as e:
-            raise ConnectorError(self.name, f"Failed to fetch order history: {e}") from e
+        except _ccxt().BaseError as e:
+            raise ConnectorError(self.name, "Failed to fetch order history: %s", e) from e
         return [self._map_order(o) for o in orders]
 
     async def close(self) -> None:
-        if self._exchange is not None:
-            await self._exchange.close()
-            self._exchange = None
+        # Swap the handle out before awaiting so a concurrent close() sees None
+        # and the underlying session is closed exactly once.
+        exchange, self._exchange = self._exchange, None
+        if exchange is not None:
+            await exchange.close()
             logger.info("CCXT connector closed")
 
-    def _map_order(self, data: dict) -> Order:
-        status_str = data.get("status", "open")
-        filled = float(data.get("filled", 0) or 0)
-        amount = float(data.get("amount", 0) or 0)
-
-        if status_str == "open" and filled > 0 and filled < amount:
-            status = OrderStatus.PARTIALLY_FILLED
-        else:
-            status = _CCXT_STATUS_MAP.get(status_str, OrderStatus.OPEN)
-
-        return Order(
-            order_id=str(data["id"]),
-            symbol=data["symbol"],
-            side=OrderSide(data["side"]),
-            type=OrderType(data["type"]) if data.get("type") in ("market", "limit") else OrderType.MARKET,
-            quantity=Decimal(str(amount)),
-            price=Decimal(str(data["price"])) if data.get("price") else None,
-            filled_quantity=Decimal(str(filled)),
-            status=status,
-            connector_name=self.name,
-            raw_data=data,
-        )
+    def map_order_json(self, raw: bytes | str) -> Order:
+        """Map a raw ccxt order JSON message (e.g. from a websocket feed) to an Order.
+
+        Parses with pydantic-core's single-pass jiter parser instead of json.loads.
+        """
+        return self._map_order(from_json(raw))
+
+    def _map_order(self, data: dict, validate: bool = True) -> Order:
+        """Map a ccxt order dict to an Order.
+
+        Orders are validated by default. Callers holding a dict ccxt has already
+        normalized can pass ``validate=False`` to assemble it with
+        construct_trusted; orders that path cannot vouch for (no id or symbol,
+        unknown side) are still validated, so bad payloads raise a
+        ValidationError naming the field rather than a bare KeyError.
+        """
+        filled = to_decimal(data.get("filled"))
+        amount = to_decimal(data.get("amount"))
+        order_id = data.get("id")
+        fields: dict[str, Any] = {
+            "order_id": None if order_id is None else str(order_id),
+            "symbol": data.get("symbol"),
+            "side": data.get("side"),
+            "type": ORDER_TYPE_BY_VALUE.get(data.get("type"), OrderType.MARKET),  # type: ignore[arg-type]
+            "quantity": amount,
+            "price": to_decimal(data["price"]) if data.get("price") else None,
+            "filled_quantity": filled,
+            "status": _resolve_status(data.get("status", "open"), filled, amount),
+            "connector_name": self.name,
+            "created_at": datetime.now(UTC),
+            "raw_data": data if self._include_raw else None,
+        }
+        if not validate:
+            side = ORDER_SIDE_BY_VALUE.get(fields["side"])
+            if side is not None and order_id is not None and isinstance(fields["symbol"], str):
+                fields["side"] = side
+                return construct_trusted(Order, **fields)
+        return Order(**fields)
+
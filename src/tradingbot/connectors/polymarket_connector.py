@@ -1,10 +1,28 @@
-"""Polymarket connector for prediction markets (sync client wrapped as async)."""
+"""Polymarket connector for prediction markets (async HTTP, sync client for signing)."""
 
+import json
 import logging
-from decimal import Decimal
+import time
+from datetime import UTC, datetime
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from typing import Any
 
+import aiohttp
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType as ClobOrderType
+from py_clob_client.clob_types import OrderArgs, RequestArgs
+from py_clob_client.clob_types import OrderType as ClobOrderType
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.endpoints import (
+    CANCEL,
+    GET_BALANCE_ALLOWANCE,
+    GET_MARKETS,
+    GET_ORDER,
+    GET_ORDER_BOOK,
+    ORDERS,
+    POST_ORDER,
+)
+from py_clob_client.headers.headers import create_level_2_headers
+from py_clob_client.utilities import order_to_json
 
 from tradingbot.core.exceptions import ConnectorError, OrderError
 from tradingbot.core.models import (
@@ -12,6 +30,7 @@ from tradingbot.core.models import (
     Market,
     Order,
     OrderBook,
+    OrderBookArrays,
     OrderBookEntry,
     OrderSide,
     OrderStatus,
@@ -19,13 +38,28 @@ from tradingbot.core.models import (
     Position,
     Ticker,
 )
-from tradingbot.utils.async_helpers import run_in_executor
+from tradingbot.utils.async_helpers import run_in_executor, signing_worker
+from tradingbot.utils.decimal_helpers import ZERO, to_decimal
 
 logger = logging.getLogger(__name__)
 
+_MIN_ORDER_SIZE = Decimal("1")
+
+# Outcome prices are probabilities in [0, 1] on a 0.01/0.001 tick, so 12
+# significant digits is always exact. Only CLOB price strings go through this
+# context; sizes and balances can exceed 12 digits and stay on to_decimal.
+_CTX = Context(prec=12, rounding=ROUND_HALF_EVEN)
+_price = _CTX.create_decimal
+
 
 class PolymarketConnector:
-    """Connector for Polymarket prediction markets via CLOB API."""
+    """Connector for Polymarket prediction markets via CLOB API.
+
+    REST calls go straight to the CLOB over a keep-alive aiohttp session. The
+    sync ClobClient is only used to derive API credentials, sign orders and
+    build the L2 auth headers. Pass ``session`` to share a pool owned by the
+    caller; otherwise the connector opens (and closes) its own.
+    """
 
     name: str = "polymarket"
 
@@ -34,11 +68,18 @@ class PolymarketConnector:
         private_key: str = "",
         chain_id: int = 137,
         host: str = "https://clob.polymarket.com",
+        session: aiohttp.ClientSession | None = None,
+        markets_ttl: float = 60.0,
     ) -> None:
         self._private_key = private_key
         self._chain_id = chain_id
         self._host = host
         self._client: ClobClient | None = None
+        self._session = session
+        self._owns_session = session is None
+        # The market list changes on the order of minutes; avoid refetching it per poll
+        self._markets_ttl = markets_ttl
+        self._markets_cache: tuple[float, list[Market]] | None = None
 
     @property
     def client(self) -> ClobClient:
@@ -46,66 +87,113 @@ class PolymarketConnector:
             raise ConnectorError(self.name, "Connector not initialized. Call initialize() first.")
         return self._client
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            raise ConnectorError(self.name, "Connector not initialized. Call initialize() first.")
+        return self._session
+
     async def initialize(self) -> None:
         try:
-            self._client = ClobClient(
+            client = ClobClient(
                 self._host,
                 key=self._private_key,
                 chain_id=self._chain_id,
             )
             # Derive API credentials from the private key
-            await run_in_executor(self._client.set_api_creds, self._client.create_or_derive_api_creds())
+            client.set_api_creds(await run_in_executor(client.create_or_derive_api_creds))
+            self._client = client
+            if self._session is None:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+                )
             logger.info("Polymarket connector initialized (chain_id=%d)", self._chain_id)
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to initialize: {e}") from e
+            raise ConnectorError(self.name, "Failed to initialize: %s", e) from e
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+        auth: bool = False,
+    ) -> Any:
+        """Call a CLOB endpoint, signing it with L2 headers when auth is set."""
+        data = json.dumps(body, separators=(",", ":"), ensure_ascii=False) if body is not None else None
+        headers = {"Content-Type": "application/json"}
+        if auth:
+            request_args = RequestArgs(method=method, request_path=path, body=body, serialized_body=data)
+            headers.update(create_level_2_headers(self.client.signer, self.client.creds, request_args))
+        async with self.session.request(
+            method, self._host + path, params=params, data=data, headers=headers
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.json()
 
     async def get_balance(self) -> list[Balance]:
         # Polymarket uses USDC on Polygon — balance is fetched from the CLOB API
         try:
-            balance_data = await run_in_executor(self.client.get_balance_allowance)
-            usdc_balance = Decimal(str(balance_data.get("balance", 0)))
+            balance_data = await self._request(
+                "GET",
+                GET_BALANCE_ALLOWANCE,
+                params={"asset_type": "COLLATERAL", "signature_type": self.client.builder.sig_type},
+                auth=True,
+            )
+            usdc_balance = to_decimal(balance_data.get("balance", 0))
             return [
                 Balance(
                     currency="USDC",
                     free=usdc_balance,
-                    used=Decimal(0),
+                    used=ZERO,
                     total=usdc_balance,
                 )
             ]
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch balance: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch balance: %s", e) from e
 
     async def get_positions(self) -> list[Position]:
         # Polymarket positions are token holdings for specific market outcomes
         return []
 
     async def get_markets(self) -> list[Market]:
+        cached = self._markets_cache
+        if cached is not None and time.monotonic() - cached[0] < self._markets_ttl:
+            return list(cached[1])
+
         try:
-            markets_data = await run_in_executor(self.client.get_markets)
+            markets_data = await self._request("GET", GET_MARKETS, params={"next_cursor": "MA=="})
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch markets: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch markets: %s", e) from e
 
+        # Hoist loop invariants into locals; listings run to thousands of rows.
+        min_size = _MIN_ORDER_SIZE
         markets: list[Market] = []
-        for m in markets_data:
-            condition_id = m.get("condition_id", "")
-            question = m.get("question", condition_id)
-            markets.append(
+        append = markets.append
+        for m in markets_data.get("data", []):
+            get = m.get
+            condition_id = get("condition_id", "")
+            append(
                 Market(
                     symbol=condition_id,
-                    base_currency=question,
+                    base_currency=get("question", condition_id),
                     quote_currency="USDC",
-                    min_order_size=Decimal("1"),
+                    min_order_size=min_size,
                     precision=2,
-                    active=m.get("active", True),
+                    active=get("active") is not False,
                 )
             )
-        return markets
+        self._markets_cache = (time.monotonic(), markets)
+        return list(markets)
 
     async def get_ticker(self, symbol: str) -> Ticker:
         try:
-            book = await run_in_executor(self.client.get_order_book, symbol)
-            best_bid = Decimal(str(book.bids[0].price)) if book.bids else None
-            best_ask = Decimal(str(book.asks[0].price)) if book.asks else None
+            book = await self._request("GET", GET_ORDER_BOOK, params={"token_id": symbol})
+            bids = book.get("bids") or []
+            asks = book.get("asks") or []
+            best_bid = _price(bids[0]["price"]) if bids else None
+            best_ask = _price(asks[0]["price"]) if asks else None
             return Ticker(
                 symbol=symbol,
                 bid=best_bid,
@@ -113,18 +201,42 @@ class PolymarketConnector:
                 last=best_bid,  # CLOB doesn't provide a last price; use bid as proxy
             )
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch ticker for {symbol}: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch ticker for %s: %s", symbol, e) from e
 
     async def get_orderbook(self, symbol: str) -> OrderBook:
         try:
-            book = await run_in_executor(self.client.get_order_book, symbol)
+            book = await self._request("GET", GET_ORDER_BOOK, params={"token_id": symbol})
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch order book for {symbol}: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch order book for %s: %s", symbol, e) from e
 
+        entry, px, dec = OrderBookEntry, _price, to_decimal
         return OrderBook(
             symbol=symbol,
-            bids=[OrderBookEntry(price=Decimal(str(b.price)), quantity=Decimal(str(b.size))) for b in book.bids],
-            asks=[OrderBookEntry(price=Decimal(str(a.price)), quantity=Decimal(str(a.size))) for a in book.asks],
+            bids=[entry(price=px(b["price"]), quantity=dec(b["size"])) for b in book.get("bids") or []],
+            asks=[entry(price=px(a["price"]), quantity=dec(a["size"])) for a in book.get("asks") or []],
+        )
+
+    async def get_orderbook_arrays(self, symbol: str) -> OrderBookArrays:
+        """Fetch the book straight into float64 columns.
+
+        Skips building OrderBookEntry/Decimal objects; numpy parses the CLOB's
+        decimal strings directly. Requires the ``analytics`` extra.
+        """
+        import numpy as np
+
+        try:
+            book = await self._request("GET", GET_ORDER_BOOK, params={"token_id": symbol})
+        except Exception as e:
+            raise ConnectorError(self.name, "Failed to fetch order book for %s: %s", symbol, e) from e
+
+        bids = book.get("bids") or []
+        asks = book.get("asks") or []
+        return OrderBookArrays(
+            symbol,
+            np.array([b["price"] for b in bids], dtype=np.float64),
+            np.array([b["size"] for b in bids], dtype=np.float64),
+            np.array([a["price"] for a in asks], dtype=np.float64),
+            np.array([a["size"] for a in asks], dtype=np.float64),
         )
 
     async def place_order(
@@ -147,12 +259,16 @@ class PolymarketConnector:
             )
 
             clob_type = ClobOrderType.GTC if order_type == OrderType.LIMIT else ClobOrderType.FOK
-            signed_order = await run_in_executor(self.client.create_order, order_args, clob_type)
-            result = await run_in_executor(self.client.post_order, signed_order)
+            # Signing stays on the sync client (it may look up tick size / neg risk)
+            # and runs on the dedicated signing thread; the signed payload is then
+            # posted over the async session.
+            signed_order = await signing_worker.submit(self.client.create_order, order_args)
+            body = order_to_json(signed_order, self.client.creds.api_key, clob_type)
+            result = await self._request("POST", POST_ORDER, body=body, auth=True)
         except OrderError:
             raise
         except Exception as e:
-            raise OrderError(f"Failed to place order on {self.name}: {e}") from e
+            raise OrderError("Failed to place order on %s: %s", self.name, e) from e
 
         order_id = result.get("orderID", result.get("id", "unknown"))
         return Order(
@@ -160,8 +276,9 @@ class PolymarketConnector:
             symbol=symbol,
             side=side,
             type=order_type,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(price)),
+            quantity=to_decimal(quantity),
+            price=to_decimal(price),
+            filled_quantity=ZERO,
             status=OrderStatus.OPEN,
             connector_name=self.name,
             raw_data=result,
@@ -169,25 +286,25 @@ class PolymarketConnector:
 
     async def cancel_order(self, order_id: str, symbol: str | None = None) -> bool:
         try:
-            await run_in_executor(self.client.cancel, order_id)
+            await self._request("DELETE", CANCEL, body={"orderID": order_id}, auth=True)
             return True
         except Exception as e:
-            raise OrderError(f"Failed to cancel order {order_id}: {e}", order_id=order_id) from e
+            raise OrderError("Failed to cancel order %s: %s", order_id, e, order_id=order_id) from e
 
     async def get_order(self, order_id: str, symbol: str | None = None) -> Order:
         try:
-            result = await run_in_executor(self.client.get_order, order_id)
+            result = await self._request("GET", GET_ORDER + order_id, auth=True)
         except Exception as e:
-            raise OrderError(f"Failed to fetch order {order_id}: {e}", order_id=order_id) from e
+            raise OrderError("Failed to fetch order %s: %s", order_id, e, order_id=order_id) from e
 
         return Order(
             order_id=str(result.get("id", order_id)),
             symbol=result.get("asset_id", symbol or ""),
-            side=OrderSide.BUY if result.get("side", "").upper() == "BUY" else OrderSide.SELL,
+            side=OrderSide.BUY if (result.get("side") or "").upper() == "BUY" else OrderSide.SELL,
             type=OrderType.LIMIT,
-            quantity=Decimal(str(result.get("original_size", 0))),
-            price=Decimal(str(result.get("price", 0))),
-            filled_quantity=Decimal(str(result.get("size_matched", 0))),
+            quantity=to_decimal(result.get("original_size", 0)),
+            price=_price(result.get("price", 0)),
+            filled_quantity=to_decimal(result.get("size_matched", 0)),
             status=OrderStatus.OPEN if result.get("status") == "live" else OrderStatus.FILLED,
             connector_name=self.name,
             raw_data=result,
@@ -195,25 +312,42 @@ class PolymarketConnector:
 
     async def get_order_history(self, symbol: str | None = None) -> list[Order]:
         try:
-            orders = await run_in_executor(self.client.get_orders)
+            orders: list[dict[str, Any]] = []
+            next_cursor = "MA=="
+            while next_cursor != END_CURSOR:
+                page = await self._request("GET", ORDERS, params={"next_cursor": next_cursor}, auth=True)
+                orders.extend(page["data"])
+                next_cursor = page["next_cursor"]
         except Exception as e:
-            raise ConnectorError(self.name, f"Failed to fetch order history: {e}") from e
+            raise ConnectorError(self.name, "Failed to fetch order history: %s", e) from e
+        # Bind invariants locally: histories can be thousands of rows.
+        px, dec, name = _price, to_decimal, self.name
+        now = datetime.now(UTC)
+        buy, sell, limit = OrderSide.BUY, OrderSide.SELL, OrderType.LIMIT
+        open_, filled = OrderStatus.OPEN, OrderStatus.FILLED
         return [
             Order(
                 order_id=str(o.get("id", "")),
                 symbol=o.get("asset_id", ""),
-                side=OrderSide.BUY if o.get("side", "").upper() == "BUY" else OrderSide.SELL,
-                type=OrderType.LIMIT,
-                quantity=Decimal(str(o.get("original_size", 0))),
-                price=Decimal(str(o.get("price", 0))),
-                filled_quantity=Decimal(str(o.get("size_matched", 0))),
-                status=OrderStatus.OPEN if o.get("status") == "live" else OrderStatus.FILLED,
-                connector_name=self.name,
+                side=buy if (o.get("side") or "").upper() == "BUY" else sell,
+                type=limit,
+                quantity=dec(o.get("original_size", 0)),
+                price=px(o.get("price", 0)),
+                filled_quantity=dec(o.get("size_matched", 0)),
+                status=open_ if o.get("status") == "live" else filled,
+                connector_name=name,
+                created_at=now,
                 raw_data=o,
             )
             for o in orders
         ]
 
     async def close(self) -> None:
+        session = self._session
+        if self._owns_session:
+            self._session = None
+            if session is not None:
+                await session.close()
         self._client = None
+        self._markets_cache = None
         logger.info("Polymarket connector closed")
@@ -53,9 +53,17 @@ class BaseConnector(Protocol):
 
 @runtime_checkable
 class BaseStrategy(Protocol):
-    """Async interface for trading strategies."""
+    """Async interface for trading strategies.
+
+    Strategies that subclass this protocol inherit the attribute defaults;
+    structural implementations must declare them.
+    """
 
     name: str
+    # Connector that signals without a connector_name are routed to
+    connector_name: str = ""
+    # Seconds between evaluate() calls
+    tick_interval: float = 1.0
 
     async def initialize(self, connectors: dict[str, BaseConnector]) -> None: ...
 
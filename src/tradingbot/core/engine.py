@@ -2,23 +2,33 @@
 
 import asyncio
 import logging
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TypeVar
 
-from tradingbot.config.settings import AppSettings
+from tradingbot.config.settings import AppSettings, get_settings
 from tradingbot.connectors.alpaca_connector import AlpacaConnector
 from tradingbot.connectors.ccxt_connector import CCXTConnector
 from tradingbot.connectors.polymarket_connector import PolymarketConnector
 from tradingbot.core.base import BaseConnector, BaseStrategy
 from tradingbot.core.exceptions import ConnectorError
-from tradingbot.core.models import Balance, Position
+from tradingbot.core.models import Balance, Position, Signal
+from tradingbot.utils.async_helpers import close_shared_session, get_shared_session
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_MAX_BACKOFF = 30.0
+
 
 class TradingEngine:
     """Central engine that manages connectors, strategies, and the main loop."""
 
     def __init__(self, settings: AppSettings | None = None) -> None:
-        self.settings = settings or AppSettings()
+        self.settings = settings or get_settings()
         self.connectors: dict[str, BaseConnector] = {}
         self.strategies: list[BaseStrategy] = []
         self._tasks: list[asyncio.Task] = []  # type: ignore[type-arg]
@@ -34,6 +44,8 @@ class TradingEngine:
                 api_key=s.ccxt.api_key,
                 api_secret=s.ccxt.api_secret,
                 testnet=s.ccxt.testnet,
+                include_raw=s.ccxt.include_raw,
+                session=await get_shared_session(),
             )
             await self._init_connector(conn)
 
@@ -50,6 +62,7 @@ class TradingEngine:
                 private_key=s.polymarket.private_key,
                 chain_id=s.polymarket.chain_id,
                 host=s.polymarket.host,
+                session=await get_shared_session(),
             )
             await self._init_connector(conn)
 
@@ -71,32 +84,91 @@ class TradingEngine:
 
         for strategy in self.strategies:
             await strategy.initialize(self.connectors)
-            task = asyncio.create_task(self._strategy_loop(strategy))
+            # Signals without a connector_name go to the strategy's default connector
+            default = self.connectors.get(strategy.connector_name)
+            logger.info(
+                "Strategy %s routes to %s",
+                strategy.name,
+                default.name if default else "the connector named on each signal",
+            )
+            task = asyncio.create_task(self._strategy_loop(strategy, default))
             self._tasks.append(task)
 
         logger.info("Engine started with %d strategies", len(self.strategies))
 
-    async def _strategy_loop(self, strategy: BaseStrategy) -> None:
-        """Run a strategy's evaluate() in a loop."""
+    async def _strategy_loop(
+        self, strategy: BaseStrategy, default: BaseConnector | None = None
+    ) -> None:
+        """Run a strategy's evaluate() every ``strategy.tick_interval`` seconds.
+
+        Ticks are scheduled against deadlines, so time spent in evaluate() and
+        order placement is not added on top of the interval. After an error the
+        delay doubles, up to _MAX_BACKOFF, until a tick succeeds again; it never
+        drops below the strategy's own period.
+        """
+        loop = asyncio.get_running_loop()
+        period = strategy.tick_interval
+        delay = period
+        deadline = loop.time()
         while self._running:
             try:
                 signals = await strategy.evaluate()
-                for signal in signals:
-                    connector = self.connectors.get(signal.strategy_name)
-                    if connector and not self.settings.dry_run:
-                        await connector.place_order(
-                            symbol=signal.symbol,
-                            side=signal.side,
-                            order_type=signal.order_type,
-                            quantity=str(signal.quantity),
-                            price=str(signal.price) if signal.price else None,
-                        )
-                        logger.info("Executed signal: %s %s %s", signal.side, signal.quantity, signal.symbol)
-                    elif self.settings.dry_run and signals:
-                        logger.info("[DRY RUN] Signal: %s %s %s", signal.side, signal.quantity, signal.symbol)
+                await self._execute_signals(signals, default)
+                delay = period
             except Exception:
                 logger.exception("Error in strategy %s", strategy.name)
-            await asyncio.sleep(1)
+                delay = min(max(delay * 2, 1.0, period), max(period, _MAX_BACKOFF))
+            # Skip missed ticks instead of bursting to catch up
+            now = loop.time()
+            deadline = max(deadline + delay, now)
+            await asyncio.sleep(deadline - now)
+
+    async def _execute_signals(
+        self, signals: list[Signal], default: BaseConnector | None = None
+    ) -> None:
+        """Place orders for all signals concurrently, logging individual failures.
+
+        Each signal goes to the connector named by ``signal.connector_name``, or
+        to ``default`` when it names none.
+        """
+        # Checked per batch, not at import: logging is configured after this module loads
+        log_info = logger.isEnabledFor(logging.INFO)
+        if self.settings.dry_run:
+            if log_info:
+                for signal in signals:
+                    logger.info("[DRY RUN] Signal: %s %s %s", signal.side, signal.quantity, signal.symbol)
+            return
+
+        connectors = self.connectors
+        placed: list[Signal] = []
+        orders = []
+        for signal in signals:
+            connector = connectors.get(signal.connector_name) if signal.connector_name else default
+            if connector is None:
+                logger.warning(
+                    "No connector for signal from %s (connector_name=%r); dropped",
+                    signal.strategy_name, signal.connector_name,
+                )
+            else:
+                placed.append(signal)
+                orders.append(
+                    connector.place_order(
+                        symbol=signal.symbol,
+                        side=signal.side,
+                        order_type=signal.order_type,
+                        quantity=str(signal.quantity),
+                        price=str(signal.price) if signal.price else None,
+                    )
+                )
+        results = await asyncio.gather(*orders, return_exceptions=True)
+        for signal, result in zip(placed, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to execute signal: %s %s %s",
+                    signal.side, signal.quantity, signal.symbol, exc_info=result,
+                )
+            elif log_info:
+                logger.info("Executed signal: %s %s %s", signal.side, signal.quantity, signal.symbol)
 
     async def stop(self) -> None:
         """Stop all strategies and close all connectors."""
@@ -111,35 +183,49 @@ class TradingEngine:
             except Exception:
                 logger.exception("Error stopping strategy %s", strategy.name)
 
-        for name, connector in self.connectors.items():
-            try:
-                await connector.close()
-            except Exception:
-                logger.exception("Error closing connector %s", name)
+        await self.close_connectors()
 
         self._tasks.clear()
         logger.info("Engine stopped")
 
+    async def close_connectors(self) -> None:
+        """Close all connectors concurrently, logging (not raising) individual failures.
+
+        The shared HTTP session is closed last, once no connector can still use it.
+        """
+        results = await asyncio.gather(
+            *(c.close() for c in self.connectors.values()), return_exceptions=True
+        )
+        for name, error in zip(self.connectors, results):
+            if isinstance(error, Exception):
+                logger.error("Error closing connector %s", name, exc_info=error)
+        await close_shared_session()
+
     async def get_all_balances(self) -> dict[str, list[Balance]]:
-        """Fetch balances from all connected exchanges."""
-        result: dict[str, list[Balance]] = {}
-        for name, connector in self.connectors.items():
-            try:
-                result[name] = await connector.get_balance()
-            except ConnectorError as e:
-                logger.error("Failed to get balance from %s: %s", name, e)
-                result[name] = []
-        return result
+        """Fetch balances from all connected exchanges concurrently."""
+        return await self._fan_out(lambda c: c.get_balance(), "balance")
 
     async def get_all_positions(self) -> dict[str, list[Position]]:
-        """Fetch positions from all connected exchanges."""
-        result: dict[str, list[Position]] = {}
-        for name, connector in self.connectors.items():
-            try:
-                result[name] = await connector.get_positions()
-            except ConnectorError as e:
-                logger.error("Failed to get positions from %s: %s", name, e)
+        """Fetch positions from all connected exchanges concurrently."""
+        return await self._fan_out(lambda c: c.get_positions(), "positions")
+
+    async def _fan_out(
+        self, fetch: Callable[[BaseConnector], Awaitable[list[T]]], what: str
+    ) -> dict[str, list[T]]:
+        """Run fetch on every connector at once; a ConnectorError yields an empty list."""
+        names = list(self.connectors)
+        results = await asyncio.gather(
+            *(fetch(c) for c in self.connectors.values()), return_exceptions=True
+        )
+        result: dict[str, list[T]] = {}
+        for name, items in zip(names, results):
+            if isinstance(items, ConnectorError):
+                logger.error("Failed to get %s from %s: %s", what, name, items)
                 result[name] = []
+            elif isinstance(items, BaseException):
+                raise items
+            else:
+                result[name] = items
         return result
 
     @property
@@ -149,3 +235,45 @@ class TradingEngine:
     @property
     def connected_exchanges(self) -> list[str]:
         return list(self.connectors.keys())
+
+
+@dataclass(slots=True)
+class _SharedEngine:
+    engine: TradingEngine
+    ready: asyncio.Future[None]
+    users: int = 0
+
+
+# Engines are tied to the loop their connectors' sessions were opened on
+_shared_engines: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedEngine] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@asynccontextmanager
+async def engine_context(settings: AppSettings | None = None) -> AsyncIterator[TradingEngine]:
+    """Yield an initialized engine that nested or concurrent callers share.
+
+    Sharing only covers callers on the same event loop that enter while another
+    caller is still inside: they reuse its engine rather than re-initializing
+    connectors (ccxt's load_markets() is a full REST fetch). Once the last user
+    exits the connectors are closed, and the next caller gets a fresh engine.
+    Joining an open context with different ``settings`` raises ValueError.
+    """
+    loop = asyncio.get_running_loop()
+    shared = _shared_engines.get(loop)
+    if shared is None:
+        engine = TradingEngine(settings)
+        shared = _SharedEngine(engine, asyncio.ensure_future(engine.initialize()))
+        _shared_engines[loop] = shared
+    elif settings is not None and settings != shared.engine.settings:
+        raise ValueError("engine_context() is already open with different settings")
+    shared.users += 1
+    try:
+        await shared.ready
+        yield shared.engine
+    finally:
+        shared.users -= 1
+        if shared.users == 0:
+            del _shared_engines[loop]
+            await shared.engine.close_connectors()
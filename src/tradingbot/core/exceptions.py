@@ -1,24 +1,76 @@
 """Custom exceptions for the trading bot."""
 
+from typing import Any
+
 
 class TradingBotError(Exception):
     """Base exception for all trading bot errors."""
 
 
-class ConnectorError(TradingBotError):
-    """Raised when a connector encounters an error communicating with an exchange."""
+class _FormattedError(TradingBotError):
+    """Error whose message, like a logging call, is %-formatted on demand.
+
+    ``args`` still reads as the usual one-element tuple holding the full text.
+    """
+
+    def __init__(self, message: str, *args: object) -> None:
+        super().__init__()
+        self.message_template = message
+        self.format_args = args
+        self._args: tuple[Any, ...] | None = None
+
+    @property
+    def message(self) -> str:
+        fmt_args = self.format_args
+        return self.message_template % fmt_args if fmt_args else self.message_template
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        return (str(self),) if self._args is None else self._args
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        self._args = tuple(value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
 
-    def __init__(self, connector_name: str, message: str) -> None:
+class ConnectorError(_FormattedError):
+    """Raised when a connector encounters an error communicating with an exchange.
+
+    ``message`` may contain %-placeholders filled from the remaining positional
+    arguments; the text is only built when the error is formatted.
+    """
+
+    def __init__(self, connector_name: str, message: str, *args: object) -> None:
         self.connector_name = connector_name
-        super().__init__(f"[{connector_name}] {message}")
+        super().__init__(message, *args)
+
+    def __str__(self) -> str:
+        return f"[{self.connector_name}] {self.message}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        init_args = (self.connector_name, self.message_template, *self.format_args)
+        return type(self), init_args, self.__dict__
 
 
-class OrderError(TradingBotError):
-    """Raised when an order operation fails."""
+class OrderError(_FormattedError):
+    """Raised when an order operation fails.
 
-    def __init__(self, message: str, order_id: str | None = None) -> None:
+    Positional arguments after ``message`` fill its %-placeholders lazily, as
+    with ConnectorError.
+    """
+
+    def __init__(self, message: str, *args: object, order_id: str | None = None) -> None:
         self.order_id = order_id
-        super().__init__(message)
+        super().__init__(message, *args)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.message_template, *self.format_args), self.__dict__
 
 
 class ConfigError(TradingBotError):
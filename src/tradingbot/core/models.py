@@ -1,10 +1,25 @@
 """Core data models for the trading bot."""
 
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import StrEnum
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, Self, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from tradingbot.utils.decimal_helpers import to_ticks
 
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    _FloatArray = npt.NDArray[np.float64]
 
 
 class OrderSide(StrEnum):
@@ -27,14 +42,49 @@ class OrderStatus(StrEnum):
     EXPIRED = "expired"
 
 
+# Shared config for exchange-facing records: immutable once built, and unknown
+# payload keys are dropped rather than rejected. Pydantic models have no slots
+# option; OrderBookEntry, the one per-row type, is a slotted dataclass instead.
+_RECORD_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+# value -> member tables for hot mappers: a dict hit instead of EnumMeta.__call__
+ORDER_SIDE_BY_VALUE: dict[str, OrderSide] = {m.value: m for m in OrderSide}
+ORDER_TYPE_BY_VALUE: dict[str, OrderType] = {m.value: m for m in OrderType}
+ORDER_STATUS_BY_VALUE: dict[str, OrderStatus] = {m.value: m for m in OrderStatus}
+
+
+def _nan_or_float(value: Decimal | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+class _CachedRecord(BaseModel):
+    """Frozen record whose cached_property views are derived from its fields.
+
+    The cached values live in the instance ``__dict__`` next to the fields, so
+    model_copy drops them; otherwise ``update=`` would carry stale views over.
+    """
+
+    model_config = _RECORD_CONFIG
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        state = copied.__dict__
+        for name in state.keys() - type(self).model_fields.keys():
+            del state[name]
+        return copied
+
+
 class Balance(BaseModel):
+    model_config = _RECORD_CONFIG
+
     currency: str
     free: Decimal = Decimal(0)
     used: Decimal = Decimal(0)
     total: Decimal = Decimal(0)
 
 
-class Position(BaseModel):
+class Position(_CachedRecord):
+
     symbol: str
     quantity: Decimal
     entry_price: Decimal
@@ -43,8 +93,29 @@ class Position(BaseModel):
     side: OrderSide
     connector_name: str = ""
 
+    # float64 views for strategy and risk math. Decimal stays the stored and
+    # serialized value; floats are exact to ~15 significant digits, which covers
+    # any realistic price or size but not accumulated accounting totals.
+    @cached_property
+    def quantity_f(self) -> float:
+        return float(self.quantity)
+
+    @cached_property
+    def entry_price_f(self) -> float:
+        return float(self.entry_price)
+
+    @cached_property
+    def current_price_f(self) -> float:
+        return float(self.current_price)
+
+    @cached_property
+    def unrealized_pnl_f(self) -> float:
+        return float(self.unrealized_pnl)
+
 
 class Order(BaseModel):
+    model_config = _RECORD_CONFIG
+
     order_id: str
     symbol: str
     side: OrderSide
@@ -58,7 +129,68 @@ class Order(BaseModel):
     raw_data: dict | None = None
 
 
+_M = TypeVar("_M", bound=BaseModel)
+_new = object.__new__
+_set_attr = object.__setattr__
+# BaseModel's own slot descriptors, bound once; calling them directly skips the
+# attribute lookup object.__setattr__ does by name on every build.
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+# Field names per model class, for construct_trusted's key check
+_FIELD_NAMES: dict[type[BaseModel], frozenset[str]] = {}
+
+
+def _field_names(cls: type[BaseModel]) -> frozenset[str]:
+    names = _FIELD_NAMES[cls] = frozenset(cls.model_fields)
+    return names
+
+
+def _field_mismatch(cls: type[BaseModel], values: dict[str, Any]) -> str:
+    missing = [name for name in cls.model_fields if name not in values]
+    unknown = sorted(values.keys() - cls.model_fields.keys())
+    problems = []
+    if missing:
+        problems.append(f"missing fields: {', '.join(missing)}")
+    if unknown:
+        problems.append(f"unknown fields: {', '.join(unknown)}")
+    return f"construct_trusted({cls.__name__}) got {'; '.join(problems)}"
+
+
+def construct_trusted(cls: type[_M], **values: Any) -> _M:
+    """Build a model straight from a complete set of already-typed field values.
+
+    Unlike model_construct this neither fills defaults nor checks aliases: the
+    caller passes every field and the kwargs dict becomes the instance
+    ``__dict__``. Values are not validated, so only use it on data the caller
+    has already normalized. Missing or unknown field names raise ValueError.
+    """
+    names = _FIELD_NAMES.get(cls) or _field_names(cls)
+    if values.keys() != names:
+        raise ValueError(_field_mismatch(cls, values))
+    obj = _new(cls)
+    _set_attr(obj, "__dict__", values)
+    _set_fields_set(obj, set(values))
+    _set_extra(obj, None)
+    _set_private(obj, None)
+    return obj
+
+
+@dataclass(slots=True, frozen=True)
+class MarketRow:
+    """Unvalidated market record for bulk listings where a full Market is not needed."""
+
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    min_order_size: Decimal = Decimal(0)
+    precision: int = 8
+    active: bool = True
+
+
 class Market(BaseModel):
+    model_config = _RECORD_CONFIG
+
     symbol: str
     base_currency: str
     quote_currency: str
@@ -66,32 +198,141 @@ class Market(BaseModel):
     precision: int = 8
     active: bool = True
 
+    @classmethod
+    def from_row(cls, row: MarketRow) -> Market:
+        return cls(
+            symbol=row.symbol,
+            base_currency=row.base_currency,
+            quote_currency=row.quote_currency,
+            min_order_size=row.min_order_size,
+            precision=row.precision,
+            active=row.active,
+        )
+
+
+class Ticker(_CachedRecord):
 
-class Ticker(BaseModel):
     symbol: str
     bid: Decimal | None = None
     ask: Decimal | None = None
     last: Decimal | None = None
     volume_24h: Decimal | None = None
 
+    # float64 views for strategy math (see Position); missing values are NaN so
+    # they propagate through arithmetic instead of raising.
+    @cached_property
+    def bid_f(self) -> float:
+        return _nan_or_float(self.bid)
+
+    @cached_property
+    def ask_f(self) -> float:
+        return _nan_or_float(self.ask)
+
+    @cached_property
+    def last_f(self) -> float:
+        return _nan_or_float(self.last)
+
+    @cached_property
+    def volume_24h_f(self) -> float:
+        return _nan_or_float(self.volume_24h)
+
+
+@dataclass(slots=True, frozen=True)
+class OrderBookEntry:
+    """A single price level. Built per book row, so it is a plain dataclass, not a model."""
 
-class OrderBookEntry(BaseModel):
     price: Decimal
     quantity: Decimal
 
+    def to_ticks(self, price_precision: int, size_precision: int = 0) -> tuple[int, int]:
+        """Return (price, quantity) as integer ticks/lots for integer-only book math."""
+        return to_ticks(self.price, price_precision), to_ticks(self.quantity, size_precision)
+
+
+def _float_column(values: Iterable[float], count: int) -> _FloatArray:
+    """float64 array from an iterable of numbers; numpy is the optional ``analytics`` extra."""
+    import numpy as np
+
+    return np.fromiter(values, dtype=np.float64, count=count)
+
+
+def _level_columns(levels: Sequence[Sequence[Any]]) -> tuple[_FloatArray, _FloatArray]:
+    """Split [[price, size, ...], ...] levels into float64 price and size columns."""
+    import numpy as np
+
+    table = np.array([level[:2] for level in levels], dtype=np.float64).reshape(-1, 2)
+    return table[:, 0], table[:, 1]
+
+
+@dataclass(slots=True, frozen=True)
+class OrderBookArrays:
+    """Structure-of-arrays order book: one float64 column per side and field.
+
+    Cheaper than OrderBook for deep books and the input to vectorised analytics;
+    Decimal precision is not kept. Requires numpy (the ``analytics`` extra).
+    """
 
-class OrderBook(BaseModel):
+    symbol: str
+    bid_prices: _FloatArray
+    bid_sizes: _FloatArray
+    ask_prices: _FloatArray
+    ask_sizes: _FloatArray
+
+    @classmethod
+    def from_levels(
+        cls, symbol: str, bids: Sequence[Sequence[Any]], asks: Sequence[Sequence[Any]]
+    ) -> OrderBookArrays:
+        """Build from ccxt-style ``[[price, size, ...], ...]`` levels."""
+        bid_prices, bid_sizes = _level_columns(bids)
+        ask_prices, ask_sizes = _level_columns(asks)
+        return cls(symbol, bid_prices, bid_sizes, ask_prices, ask_sizes)
+
+
+class OrderBook(_CachedRecord):
     symbol: str
     bids: list[OrderBookEntry] = []
     asks: list[OrderBookEntry] = []
 
+    # Column views for vectorised analytics (spread, VWAP, depth). Computed once
+    # per book, so do not mutate the bids/asks lists in place after first access;
+    # model_copy(update=...) recomputes them.
+
+    @cached_property
+    def bid_prices(self) -> _FloatArray:
+        return _float_column((float(e.price) for e in self.bids), len(self.bids))
+
+    @cached_property
+    def bid_sizes(self) -> _FloatArray:
+        return _float_column((float(e.quantity) for e in self.bids), len(self.bids))
+
+    @cached_property
+    def ask_prices(self) -> _FloatArray:
+        return _float_column((float(e.price) for e in self.asks), len(self.asks))
+
+    @cached_property
+    def ask_sizes(self) -> _FloatArray:
+        return _float_column((float(e.quantity) for e in self.asks), len(self.asks))
+
+    def as_arrays(self) -> tuple[_FloatArray, _FloatArray, _FloatArray, _FloatArray]:
+        """Return (bid_prices, bid_sizes, ask_prices, ask_sizes) as float64 arrays."""
+        return self.bid_prices, self.bid_sizes, self.ask_prices, self.ask_sizes
+
+    def to_arrays(self) -> OrderBookArrays:
+        return OrderBookArrays(self.symbol, *self.as_arrays())
+
+
+# Bounds live in the type so pydantic-core enforces them natively and other
+# models (e.g. strategy outputs) can reuse the same constraint.
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+
 
 class Signal(BaseModel):
     strategy_name: str
     symbol: str
+    connector_name: str = ""
     side: OrderSide
     quantity: Decimal
     order_type: OrderType = OrderType.MARKET
     price: Decimal | None = None
     reason: str = ""
-    confidence: float = Field(default=0.0, ge=0.0, le=1.0)
+    confidence: Confidence = 0.0
@@ -1,22 +1,122 @@
 """Async utility helpers for wrapping sync libraries."""
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import partial
-from typing import Any, Callable, TypeVar
+from typing import Any, TypeVar
+
+import aiohttp
 
 T = TypeVar("T")
 
-_executor = ThreadPoolExecutor(max_workers=4)
+logger = logging.getLogger(__name__)
+
+
+def _default_workers() -> int:
+    """Pool size from ``TRADINGBOT_EXECUTOR_WORKERS``, else the asyncio default.
+
+    Runs at import, so a bad value is logged and ignored rather than raised.
+    """
+    default = min(32, (os.cpu_count() or 1) + 4)
+    value = os.environ.get("TRADINGBOT_EXECUTOR_WORKERS")
+    if not value:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning(
+            "Ignoring TRADINGBOT_EXECUTOR_WORKERS=%r (expected a positive integer); using %d",
+            value,
+            default,
+        )
+        return default
+    return workers
+
+
+_executor = ThreadPoolExecutor(max_workers=_default_workers(), thread_name_prefix="tradingbot")
 
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
 
-async def run_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+
+async def run_in_executor(
+    func: Callable[..., T], *args: Any, executor: Executor | None = None, **kwargs: Any
+) -> T:
     """Run a synchronous function in a thread pool executor.
 
     Used by Alpaca and Polymarket connectors to wrap their sync clients
     so they present an async interface without blocking the event loop.
+    Pass ``executor`` to use a dedicated pool instead of the shared one.
     """
     loop = asyncio.get_running_loop()
     if kwargs:
         func = partial(func, **kwargs)
-    return await loop.run_in_executor(_executor, func, *args)
+    return await loop.run_in_executor(executor or _executor, func, *args)
+
+
+class _SigningWorker:
+    """A single long-lived thread that runs sync jobs in submission order.
+
+    Keeps short, frequent jobs such as order signing serialized and off the
+    shared pool, so one order's signing can overlap the previous order's HTTP
+    round trip. The thread is started on first use; a job's exception is
+    raised to whoever awaits its future.
+    """
+
+    def __init__(self, name: str = "signing") -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+    def submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> asyncio.Future[T]:
+        """Queue ``func(*args, **kwargs)`` and return a future on the running loop."""
+        loop = asyncio.get_running_loop()
+        return asyncio.wrap_future(self._executor.submit(func, *args, **kwargs), loop=loop)
+
+
+signing_worker = _SigningWorker()
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on first use.
+
+    The session is bound to the running loop; a new one is created if the
+    previous session was closed or belongs to another loop (e.g. a later
+    ``asyncio.run`` in the CLI), and that stale session is then closed. The
+    replacement is installed before the first await point, so concurrent
+    callers on the same loop all get the new session.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        stale, stale_loop = _session, _session_loop
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=16, keepalive_timeout=75),
+        )
+        _session_loop = loop
+        if stale is not None and not stale.closed:
+            await _close_stale_session(stale, stale_loop)
+    return _session
+
+
+async def _close_stale_session(
+    session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    if loop is not None and not loop.is_closed():
+        # Its loop is still alive (e.g. in another thread); close it there
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    # The owning loop is gone and its connections with it; this only releases
+    # the session and its connector so they are not reported as unclosed.
+    await session.close()
+
+
+async def close_shared_session() -> None:
+    """Close the shared session if one is open."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
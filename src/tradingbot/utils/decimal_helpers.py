@@ -0,0 +1,50 @@
+"""Decimal conversion helpers for exchange payloads."""
+
+from decimal import Decimal
+from functools import lru_cache
+
+ZERO = Decimal(0)
+
+# Missing or zero values all map to the shared ZERO instance. 0 also matches
+# 0.0 and Decimal("0.00") since they hash and compare equal.
+_ZERO_VALUES = frozenset({None, "", 0, "0"})
+
+
+@lru_cache(maxsize=4096)
+def _float_to_decimal(value: float) -> Decimal:
+    # Decimal is immutable, so cached instances are safe to share. Prices and
+    # sizes repeat heavily across ticks and book levels.
+    return Decimal(repr(value))
+
+
+def to_decimal(value: object) -> Decimal:
+    """Convert an exchange-supplied number to Decimal.
+
+    Strings and ints go straight into Decimal; floats are converted through
+    their shortest repr so 0.1 becomes Decimal("0.1") rather than its binary
+    expansion (recent conversions are cached). None, "" and zero values
+    return the shared ZERO constant.
+    """
+    if value in _ZERO_VALUES:
+        return ZERO
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    if isinstance(value, float):
+        return _float_to_decimal(value)
+    return Decimal(str(value))
+
+
+def to_ticks(value: Decimal, precision: int) -> int:
+    """Scale a Decimal to an integer count of ``10 ** -precision`` units.
+
+    Exact for values that already fit the precision (e.g. "0.53" at 2);
+    finer digits are rounded half-even.
+    """
+    return int(value.scaleb(precision).to_integral_value())
+
+
+def from_ticks(ticks: int, precision: int) -> Decimal:
+    """Inverse of to_ticks."""
+    return Decimal(ticks).scaleb(-precision)
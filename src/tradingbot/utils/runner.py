@@ -0,0 +1,28 @@
+"""Event loop entry point: uvloop when available, stdlib asyncio otherwise."""
+
+import asyncio
+import importlib.util
+import sys
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def has_uvloop() -> bool:
+    """Return True if uvloop is installed and usable on this platform."""
+    return sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion in a new event loop (uvloop when available).
+
+    Use this instead of ``asyncio.run`` in any entry point that drives the
+    engine. ``uvloop.run`` replaces the deprecated ``uvloop.install()`` policy
+    approach.
+    """
+    if has_uvloop():
+        import uvloop
+
+        return uvloop.run(coro)
+    return asyncio.run(coro)
@@ -1,12 +1,13 @@
 """FastAPI web dashboard for the trading bot."""
 
 import asyncio
-import json
 import logging
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 
 from tradingbot.core.engine import TradingEngine
@@ -16,19 +17,106 @@ logger = logging.getLogger(__name__)
 STATIC_DIR = Path(__file__).parent / "static"
 
 
+_WS_INTERVAL = 5.0
+_WS_NOOP = orjson.dumps({"type": "noop"}).decode()
+
+
 def _serialize_decimal(obj: object) -> str:
     """JSON serializer for Decimal and other non-standard types."""
     return str(obj)
 
 
+class _SnapshotBroadcaster:
+    """Builds one dashboard snapshot per tick and shares it with every websocket client.
+
+    The poll task only runs while at least one client is subscribed. Each tick
+    bumps ``generation``; clients compare ``digest`` with what they last sent
+    and send a short noop instead of an unchanged snapshot.
+    """
+
+    def __init__(self, engine: TradingEngine, interval: float = _WS_INTERVAL) -> None:
+        self._engine = engine
+        self._interval = interval
+        self._clients = 0
+        self._task: asyncio.Task[None] | None = None
+        self._cond = asyncio.Condition()
+        self.generation = 0
+        self.message = ""
+        self.digest: int | None = None
+
+    def subscribe(self) -> int:
+        """Register a client and return the generation its first wait() should follow.
+
+        A snapshot held by the running task is current, so a new client gets it
+        at once; otherwise the client waits for the first tick.
+        """
+        self._clients += 1
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self.generation - 1 if self.message else self.generation
+
+    def unsubscribe(self) -> None:
+        self._clients -= 1
+        if self._clients == 0 and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # Nothing refreshes the snapshot while idle; never hand it to the next client
+            self.message = ""
+            self.digest = None
+
+    async def wait(self, after: int) -> int:
+        """Wait for a snapshot newer than generation ``after`` and return its generation."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.generation > after)
+            return self.generation
+
+    async def _run(self) -> None:
+        engine = self._engine
+        while True:
+            try:
+                balances, positions = await asyncio.gather(
+                    engine.get_all_balances(), engine.get_all_positions()
+                )
+                payload = {
+                    "type": "update",
+                    "balances": {
+                        exchange: [b.model_dump(mode="json") for b in items]
+                        for exchange, items in balances.items()
+                    },
+                    "positions": {
+                        exchange: [p.model_dump(mode="json") for p in items]
+                        for exchange, items in positions.items()
+                    },
+                    "status": {
+                        "running": engine.is_running,
+                        "connected_exchanges": engine.connected_exchanges,
+                    },
+                }
+                # Sent as a text frame: the dashboard JSON.parses event.data as a string
+                message = orjson.dumps(payload, default=_serialize_decimal).decode()
+                async with self._cond:
+                    self.message = message
+                    self.digest = hash(message)
+                    self.generation += 1
+                    self._cond.notify_all()
+            except Exception:
+                logger.exception("Failed to build websocket snapshot")
+            await asyncio.sleep(self._interval)
+
+
 def create_app(engine: TradingEngine) -> FastAPI:
     """Create the FastAPI application with routes bound to the engine."""
     app = FastAPI(title="Trading Bot Dashboard")
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    broadcaster = _SnapshotBroadcaster(engine)
+    app.mount("/static", StaticFiles(directory=str(STATIC_DIR), html=False), name="static")
+
+    # Served from memory: the page only changes on deploy
+    index_html = (STATIC_DIR / "index.html").read_bytes()
 
     @app.get("/")
-    async def index() -> FileResponse:
-        return FileResponse(STATIC_DIR / "index.html")
+    async def index() -> Response:
+        return Response(index_html, media_type="text/html", headers={"Cache-Control": "public, max-age=60"})
 
     @app.get("/api/status")
     async def api_status() -> dict:
@@ -58,30 +146,21 @@ def create_app(engine: TradingEngine) -> FastAPI:
     @app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket) -> None:
         await websocket.accept()
+        generation = broadcaster.subscribe()
+        sent_digest: int | None = None
         try:
             while True:
-                balances = await engine.get_all_balances()
-                positions = await engine.get_all_positions()
-                payload = {
-                    "type": "update",
-                    "balances": {
-                        exchange: [b.model_dump(mode="json") for b in items]
-                        for exchange, items in balances.items()
-                    },
-                    "positions": {
-                        exchange: [p.model_dump(mode="json") for p in items]
-                        for exchange, items in positions.items()
-                    },
-                    "status": {
-                        "running": engine.is_running,
-                        "connected_exchanges": engine.connected_exchanges,
-                    },
-                }
-                await websocket.send_text(json.dumps(payload, default=_serialize_decimal))
-                await asyncio.sleep(5)
+                generation = await broadcaster.wait(generation)
+                if broadcaster.digest == sent_digest:
+                    await websocket.send_text(_WS_NOOP)
+                else:
+                    await websocket.send_text(broadcaster.message)
+                    sent_digest = broadcaster.digest
         except WebSocketDisconnect:
             logger.debug("WebSocket client disconnected")
         except Exception:
             logger.exception("WebSocket error")
+        finally:
+            broadcaster.unsubscribe()
 
     return app
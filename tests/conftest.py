@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from tradingbot.config.settings import get_settings
 from tradingbot.core.models import (
     Balance,
     Market,
@@ -19,6 +20,14 @@ from tradingbot.core.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_settings_cache():
+    """get_settings() is cached per process; isolate tests that change the environment."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture
 def sample_balance():
     return Balance(currency="BTC", free=Decimal("1.5"), used=Decimal("0.5"), total=Decimal("2.0"))
@@ -90,24 +99,109 @@ def mock_connector():
     mock = AsyncMock()
     mock.name = "mock_exchange"
     mock.initialize = AsyncMock()
-    mock.get_balance = AsyncMock(return_value=[
-        Balance(currency="USD", free=Decimal("10000"), used=Decimal("0"), total=Decimal("10000"))
-    ])
+    mock.get_balance = AsyncMock(
+        return_value=[
+            Balance(
+                currency="USD", free=Decimal("10000"), used=Decimal("0"), total=Decimal("10000")
+            )
+        ]
+    )
     mock.get_positions = AsyncMock(return_value=[])
     mock.get_markets = AsyncMock(return_value=[])
     mock.get_ticker = AsyncMock(return_value=Ticker(symbol="TEST/USD"))
     mock.get_orderbook = AsyncMock(return_value=OrderBook(symbol="TEST/USD"))
-    mock.place_order = AsyncMock(return_value=Order(
-        order_id="mock-001",
-        symbol="TEST/USD",
-        side=OrderSide.BUY,
-        type=OrderType.MARKET,
-        quantity=Decimal("1"),
-        status=OrderStatus.FILLED,
-        connector_name="mock_exchange",
-    ))
+    mock.place_order = AsyncMock(
+        return_value=Order(
+            order_id="mock-001",
+            symbol="TEST/USD",
+            side=OrderSide.BUY,
+            type=OrderType.MARKET,
+            quantity=Decimal("1"),
+            status=OrderStatus.FILLED,
+            connector_name="mock_exchange",
+        )
+    )
     mock.cancel_order = AsyncMock(return_value=True)
     mock.get_order = AsyncMock()
     mock.get_order_history = AsyncMock(return_value=[])
     mock.close = AsyncMock()
     return mock
+
+
+class FakeConnector:
+    """In-memory BaseConnector returning preconstructed objects.
+
+    Plain async methods with no mock machinery, for tests that drive the engine
+    loop or measure its overhead. Use ``mock_connector`` when asserting calls.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        balances: list[Balance] | None = None,
+        positions: list[Position] | None = None,
+        orderbook: OrderBook | None = None,
+    ) -> None:
+        self.balances = balances or []
+        self.positions = positions or []
+        self.orderbook = orderbook or OrderBook(symbol="TEST/USD")
+        self.ticker = Ticker(symbol=self.orderbook.symbol)
+        self.placed: list[Order] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def get_balance(self) -> list[Balance]:
+        return self.balances
+
+    async def get_positions(self) -> list[Position]:
+        return self.positions
+
+    async def get_markets(self) -> list[Market]:
+        return []
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        return self.ticker
+
+    async def get_orderbook(self, symbol: str) -> OrderBook:
+        return self.orderbook
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        quantity: float | str,
+        price: float | str | None = None,
+    ) -> Order:
+        order = Order(
+            order_id=f"fake-{len(self.placed) + 1}",
+            symbol=symbol,
+            side=side,
+            type=order_type,
+            quantity=Decimal(quantity),
+            price=Decimal(price) if price is not None else None,
+            status=OrderStatus.FILLED,
+            connector_name=self.name,
+        )
+        self.placed.append(order)
+        return order
+
+    async def cancel_order(self, order_id: str, symbol: str | None = None) -> bool:
+        return True
+
+    async def get_order(self, order_id: str, symbol: str | None = None) -> Order:
+        return next(o for o in self.placed if o.order_id == order_id)
+
+    async def get_order_history(self, symbol: str | None = None) -> list[Order]:
+        return list(self.placed)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_connector(sample_balance, sample_position, sample_orderbook):
+    """A real in-memory connector, cheaper than AsyncMock for loop-heavy tests."""
+    return FakeConnector([sample_balance], [sample_position], sample_orderbook)
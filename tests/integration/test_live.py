@@ -12,11 +12,13 @@ from tradingbot.config.settings import AppSettings
 
 # Skip entire module if no credentials are configured
 pytestmark = pytest.mark.skipif(
-    not any([
-        os.getenv("CCXT_API_KEY"),
-        os.getenv("ALPACA_API_KEY"),
-        os.getenv("POLYMARKET_PRIVATE_KEY"),
-    ]),
+    not any(
+        [
+            os.getenv("CCXT_API_KEY"),
+            os.getenv("ALPACA_API_KEY"),
+            os.getenv("POLYMARKET_PRIVATE_KEY"),
+        ]
+    ),
     reason="No API credentials configured",
 )
 
@@ -62,7 +64,9 @@ class TestAlpacaLive:
         await conn.close()
 
 
-@pytest.mark.skipif(not os.getenv("POLYMARKET_PRIVATE_KEY"), reason="POLYMARKET_PRIVATE_KEY not set")
+@pytest.mark.skipif(
+    not os.getenv("POLYMARKET_PRIVATE_KEY"), reason="POLYMARKET_PRIVATE_KEY not set"
+)
 class TestPolymarketLive:
     @pytest.mark.asyncio
     async def test_initialize_and_balance(self, settings):
@@ -0,0 +1,62 @@
+"""Tests for order book analytics kernels."""
+
+import math
+from types import ModuleType
+
+import pytest
+
+from tradingbot.core.models import OrderBookArrays
+
+
+@pytest.fixture
+def ob_numba() -> ModuleType:
+    pytest.importorskip("numpy")
+    from tradingbot.analytics import ob_numba
+
+    return ob_numba
+
+
+@pytest.fixture
+def book(ob_numba):
+    return OrderBookArrays.from_levels(
+        "BTC/USDT",
+        [[100.0, 1.0], [99.5, 2.0], [99.0, 3.0]],
+        [[100.5, 1.5], [101.0, 0.5]],
+    )
+
+
+class TestOrderBookKernels:
+    def test_mid_and_spread(self, ob_numba, book):
+        assert ob_numba.mid_price(book.bid_prices, book.ask_prices) == 100.25
+        assert ob_numba.spread(book.bid_prices, book.ask_prices) == 0.5
+
+    def test_imbalance(self, ob_numba, book):
+        assert ob_numba.imbalance(book.bid_sizes, book.ask_sizes) == pytest.approx(4 / 8)
+
+    def test_cumulative_volume(self, ob_numba, book):
+        volume = ob_numba.cumulative_volume_to_price
+        assert volume(book.bid_prices, book.bid_sizes, 99.5, True) == 3.0
+        assert volume(book.ask_prices, book.ask_sizes, 100.5, False) == 1.5
+
+    def test_empty_book_is_nan(self, ob_numba):
+        empty = OrderBookArrays.from_levels("X/Y", [], [])
+        assert math.isnan(ob_numba.mid_price(empty.bid_prices, empty.ask_prices))
+        assert math.isnan(ob_numba.spread(empty.bid_prices, empty.ask_prices))
+        assert math.isnan(ob_numba.imbalance(empty.bid_sizes, empty.ask_sizes))
+        volume = ob_numba.cumulative_volume_to_price(empty.bid_prices, empty.bid_sizes, 1.0, True)
+        assert volume == 0.0
+
+
+class TestNumbaCompilation:
+    def test_kernels_compile_and_match_python(self, ob_numba, book):
+        pytest.importorskip("numba")
+        assert ob_numba.HAS_NUMBA
+        # Eager signatures: each kernel is already compiled for float64 columns
+        assert ob_numba.mid_price.signatures
+        for kernel, args in [
+            (ob_numba.mid_price, (book.bid_prices, book.ask_prices)),
+            (ob_numba.spread, (book.bid_prices, book.ask_prices)),
+            (ob_numba.imbalance, (book.bid_sizes, book.ask_sizes)),
+            (ob_numba.cumulative_volume_to_price, (book.bid_prices, book.bid_sizes, 99.5, True)),
+        ]:
+            assert kernel(*args) == pytest.approx(kernel.py_func(*args))
@@ -1,9 +1,13 @@
 """Tests for configuration and settings."""
 
+import os
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from tradingbot.config.loader import deep_merge, load_config, load_toml
-from tradingbot.config.settings import AppSettings
+from tradingbot.config.settings import AppSettings, get_settings
 
 
 class TestDeepMerge:
@@ -13,6 +17,13 @@ class TestDeepMerge:
         result = deep_merge(base, override)
         assert result == {"a": 1, "b": 3, "c": 4}
 
+    def test_flat_override_copies_nested_base(self):
+        base = {"a": {"x": 1}, "b": 2}
+        result = deep_merge(base, {"b": 3})
+        result["a"]["x"] = 99
+        assert result == {"a": {"x": 99}, "b": 3}
+        assert base == {"a": {"x": 1}, "b": 2}
+
     def test_nested_merge(self):
         base = {"a": {"x": 1, "y": 2}, "b": 3}
         override = {"a": {"y": 99, "z": 100}}
@@ -25,6 +36,12 @@ class TestDeepMerge:
         deep_merge(base, override)
         assert base == {"a": 1}
 
+    def test_does_not_mutate_nested_base(self):
+        base = {"a": {"x": 1}}
+        result = deep_merge(base, {"a": {"x": 2}})
+        assert result == {"a": {"x": 2}}
+        assert base == {"a": {"x": 1}}
+
 
 class TestLoadToml:
     def test_load_default_config(self):
@@ -34,6 +51,47 @@ class TestLoadToml:
             assert "bot" in config
             assert config["bot"]["name"] == "tradingbot"
 
+    def test_cached_until_modified(self, tmp_path):
+        path = tmp_path / "bot.toml"
+        path.write_text('[bot]\nname = "first"\n')
+        first = load_toml(path)
+        first["bot"]["name"] = "mutated"
+        assert load_toml(path)["bot"]["name"] == "first"
+
+        path.write_text('[bot]\nname = "second"\n')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_toml(path)["bot"]["name"] == "second"
+
+    def test_same_mtime_rewrite_is_reloaded(self, tmp_path):
+        path = tmp_path / "bot.toml"
+        path.write_text('[bot]\nname = "a"\n')
+        mtime = path.stat().st_mtime_ns
+        assert load_toml(path)["bot"]["name"] == "a"
+
+        path.write_text('[bot]\nname = "longer"\n')
+        os.utime(path, ns=(mtime, mtime))
+        assert load_toml(path)["bot"]["name"] == "longer"
+
+    def test_load_config_merges_in_order(self, tmp_path):
+        base = tmp_path / "base.toml"
+        base.write_text('[bot]\nname = "base"\ndry_run = true\n\n[web]\nport = 8000\n')
+        local = tmp_path / "local.toml"
+        local.write_text("[bot]\ndry_run = false\n")
+        config = load_config(base, local)
+        assert config == {"bot": {"name": "base", "dry_run": False}, "web": {"port": 8000}}
+
+    def test_load_config_skips_missing_candidates(self, tmp_path):
+        (tmp_path / "default.toml").write_text('[bot]\nname = "base"\n')
+        missing_dir = tmp_path / "nope"
+        config = load_config(
+            tmp_path / "default.toml",
+            tmp_path / "local.toml",
+            missing_dir / "a.toml",
+            missing_dir / "b.toml",
+        )
+        assert config == {"bot": {"name": "base"}}
+
     def test_load_missing_file_in_load_config(self):
         config = load_config(Path("/nonexistent/file.toml"))
         assert config == {}
@@ -64,3 +122,19 @@ class TestAppSettings:
         settings = AppSettings()
         assert settings.ccxt.api_key == "test_key_123"
         assert settings.log_level == "DEBUG"
+
+    def test_get_settings_reads_env_after_cache_clear(self, monkeypatch):
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+        assert get_settings().log_level == "WARNING"
+
+    def test_parse_connectors_from_string(self):
+        settings = AppSettings(enabled_connectors=" ccxt , alpaca,, ")
+        assert settings.enabled_connectors == ["ccxt", "alpaca"]
+
+    def test_frozen(self):
+        settings = AppSettings()
+        with pytest.raises(ValidationError):
+            settings.dry_run = False
+
+    def test_get_settings_is_cached(self):
+        assert get_settings() is get_settings()
@@ -1,13 +1,21 @@
 """Mock-based tests for connectors."""
 
+import asyncio
+import json
+import subprocess
+import sys
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
+from tradingbot.connectors.alpaca_connector import AlpacaConnector
 from tradingbot.connectors.ccxt_connector import CCXTConnector
-from tradingbot.core.exceptions import ConnectorError, OrderError
-from tradingbot.core.models import OrderSide, OrderStatus, OrderType
+from tradingbot.connectors.polymarket_connector import PolymarketConnector
+from tradingbot.core.exceptions import ConnectorError
+from tradingbot.core.models import Market, OrderSide, OrderStatus, OrderType
 
 
 class TestCCXTConnector:
@@ -33,14 +41,29 @@ class TestCCXTConnector:
         with pytest.raises(ConnectorError, match="Unknown exchange"):
             await conn.initialize()
 
+    @pytest.mark.asyncio
+    async def test_initialize_rejects_non_exchange_attribute(self):
+        conn = CCXTConnector(exchange_id="Exchange")
+        with pytest.raises(ConnectorError, match="Unknown exchange"):
+            await conn.initialize()
+
+    def test_module_import_defers_ccxt(self):
+        code = (
+            "import sys, tradingbot.connectors.ccxt_connector; "
+            "sys.exit('ccxt.async_support' in sys.modules)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     @pytest.mark.asyncio
     async def test_get_balance(self, connector):
         mock_exchange = AsyncMock()
-        mock_exchange.fetch_balance = AsyncMock(return_value={
-            "total": {"BTC": 1.5, "USDT": 10000},
-            "free": {"BTC": 1.0, "USDT": 8000},
-            "used": {"BTC": 0.5, "USDT": 2000},
-        })
+        mock_exchange.fetch_balance = AsyncMock(
+            return_value={
+                "total": {"BTC": 1.5, "USDT": 10000},
+                "free": {"BTC": 1.0, "USDT": 8000},
+                "used": {"BTC": 0.5, "USDT": 2000},
+            }
+        )
         connector._exchange = mock_exchange
 
         balances = await connector.get_balance()
@@ -52,6 +75,7 @@ class TestCCXTConnector:
     @pytest.mark.asyncio
     async def test_get_balance_error(self, connector):
         import ccxt.async_support as ccxt_async
+
         mock_exchange = AsyncMock()
         mock_exchange.fetch_balance = AsyncMock(side_effect=ccxt_async.BaseError("API Error"))
         connector._exchange = mock_exchange
@@ -62,16 +86,18 @@ class TestCCXTConnector:
     @pytest.mark.asyncio
     async def test_place_order(self, connector):
         mock_exchange = AsyncMock()
-        mock_exchange.create_order = AsyncMock(return_value={
-            "id": "order-1",
-            "symbol": "BTC/USDT",
-            "side": "buy",
-            "type": "limit",
-            "amount": 0.5,
-            "price": 50000,
-            "filled": 0,
-            "status": "open",
-        })
+        mock_exchange.create_order = AsyncMock(
+            return_value={
+                "id": "order-1",
+                "symbol": "BTC/USDT",
+                "side": "buy",
+                "type": "limit",
+                "amount": 0.5,
+                "price": 50000,
+                "filled": 0,
+                "status": "open",
+            }
+        )
         connector._exchange = mock_exchange
 
         order = await connector.place_order("BTC/USDT", OrderSide.BUY, OrderType.LIMIT, 0.5, 50000)
@@ -103,6 +129,52 @@ class TestCCXTConnector:
         order = connector._map_order(order_data)
         assert order.status == OrderStatus.PARTIALLY_FILLED
         assert order.filled_quantity == Decimal("5")
+        assert order.raw_data is None
+
+    def test_map_order_constructed_matches_validated(self, connector):
+        data = {
+            "id": 7,
+            "symbol": "BTC/USDT",
+            "side": "buy",
+            "type": "limit",
+            "amount": "0.5",
+            "price": 50000.5,
+            "filled": 0,
+            "status": "closed",
+        }
+        fast = connector._map_order(data, validate=False)
+        checked = connector._map_order(data)
+        assert fast.model_dump(exclude={"created_at"}) == checked.model_dump(exclude={"created_at"})
+        assert fast.created_at is not None
+
+    @pytest.mark.parametrize("side", [None, "short"])
+    def test_map_order_bad_side_is_validated(self, connector, side):
+        data = {"id": "3", "symbol": "BTC/USDT", "side": side, "type": "market", "amount": 1}
+        with pytest.raises(ValidationError, match="side"):
+            connector._map_order(data, validate=False)
+
+    def test_map_order_json_matches_dict_path(self, connector):
+        data = {
+            "id": "9",
+            "symbol": "ETH/USDT",
+            "side": "sell",
+            "type": "limit",
+            "amount": 2.5,
+            "price": 3000.1,
+            "filled": 1,
+            "status": "open",
+        }
+        from_bytes = connector.map_order_json(json.dumps(data).encode())
+        from_dict = connector._map_order(data)
+        assert from_bytes.model_dump(exclude={"created_at"}) == from_dict.model_dump(
+            exclude={"created_at"}
+        )
+        assert from_bytes.price == Decimal("3000.1")
+
+    def test_map_order_include_raw(self):
+        conn = CCXTConnector(include_raw=True)
+        data = {"id": "1", "symbol": "BTC/USDT", "side": "buy", "type": "market", "amount": 1}
+        assert conn._map_order(data).raw_data == data
 
     @pytest.mark.asyncio
     async def test_get_markets(self, connector):
@@ -123,6 +195,60 @@ class TestCCXTConnector:
         assert markets[0].symbol == "BTC/USDT"
         assert markets[0].min_order_size == Decimal("0.001")
 
+        rows = await connector.get_market_rows()
+        assert rows[0].base_currency == "BTC"
+        assert Market.from_row(rows[0]) == markets[0]
+
+    @pytest.mark.asyncio
+    async def test_get_markets_tick_size_precision(self, connector):
+        import ccxt.async_support as ccxt_async
+
+        mock_exchange = AsyncMock()
+        mock_exchange.precisionMode = ccxt_async.TICK_SIZE
+        mock_exchange.markets = {
+            "BTC/USDT": {"base": "BTC", "quote": "USDT", "precision": {"amount": 1e-05}},
+            "DOGE/USDT": {"base": "DOGE", "quote": "USDT", "precision": {"amount": 1.0}},
+        }
+        connector._exchange = mock_exchange
+
+        markets = await connector.get_markets()
+        assert [m.precision for m in markets] == [5, 0]
+        assert all(type(m.precision) is int for m in markets)
+        assert [r.precision for r in await connector.get_market_rows()] == [5, 0]
+
+    @pytest.mark.asyncio
+    async def test_get_orderbook(self, connector):
+        mock_exchange = AsyncMock()
+        mock_exchange.fetch_order_book = AsyncMock(
+            return_value={
+                "bids": [[54990.5, 1.25], [54990.0, 2]],
+                "asks": [[55010.0, 0.5, 3]],
+            }
+        )
+        connector._exchange = mock_exchange
+
+        book = await connector.get_orderbook("BTC/USDT")
+        assert [b.price for b in book.bids] == [Decimal("54990.5"), Decimal("54990.0")]
+        assert book.asks[0].quantity == Decimal("0.5")
+        assert book.model_dump(mode="json")["asks"] == [{"price": "55010.0", "quantity": "0.5"}]
+
+    @pytest.mark.asyncio
+    async def test_get_orderbook_arrays(self, connector):
+        pytest.importorskip("numpy")
+        mock_exchange = AsyncMock()
+        mock_exchange.fetch_order_book = AsyncMock(
+            return_value={
+                "bids": [[54990.5, 1.25], [54990.0, 2]],
+                "asks": [[55010.0, 0.5, 3]],
+            }
+        )
+        connector._exchange = mock_exchange
+
+        book = await connector.get_orderbook_arrays("BTC/USDT")
+        assert book.bid_prices.tolist() == [54990.5, 54990.0]
+        assert book.bid_sizes.tolist() == [1.25, 2.0]
+        assert book.ask_sizes.tolist() == [0.5]
+
     @pytest.mark.asyncio
     async def test_close(self, connector):
         mock_exchange = AsyncMock()
@@ -131,3 +257,180 @@ class TestCCXTConnector:
         await connector.close()
         mock_exchange.close.assert_called_once()
         assert connector._exchange is None
+
+    @pytest.mark.asyncio
+    async def test_injected_session_is_borrowed(self):
+        import ccxt.async_support as ccxt_async
+
+        session = AsyncMock()
+        connector = CCXTConnector(exchange_id="binance", session=session)
+        with patch.object(ccxt_async.binance, "load_markets", AsyncMock()):
+            await connector.initialize()
+        assert connector.exchange.session is session
+
+        await connector.close()
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_close_closes_once(self, connector):
+        mock_exchange = AsyncMock()
+        connector._exchange = mock_exchange
+
+        await asyncio.gather(connector.close(), connector.close())
+        mock_exchange.close.assert_awaited_once()
+
+
+class TestAlpacaConnector:
+    def test_map_order_with_sdk_enums(self):
+        from alpaca.trading.enums import OrderSide as AlpacaOrderSide
+        from alpaca.trading.enums import OrderStatus as AlpacaOrderStatus
+        from alpaca.trading.enums import OrderType as AlpacaOrderType
+
+        raw = SimpleNamespace(
+            id="abc",
+            symbol="AAPL",
+            side=AlpacaOrderSide.BUY,
+            type=AlpacaOrderType.LIMIT,
+            qty="10",
+            limit_price="150.25",
+            filled_qty="4",
+            status=AlpacaOrderStatus.PARTIALLY_FILLED,
+        )
+        order = AlpacaConnector()._map_order(raw)
+        assert order.side == OrderSide.BUY
+        assert order.type == OrderType.LIMIT
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.price == Decimal("150.25")
+        assert order.filled_quantity == Decimal("4")
+
+
+class TestPolymarketConnector:
+    @pytest.mark.asyncio
+    async def test_get_orderbook(self):
+        connector = PolymarketConnector()
+        connector._request = AsyncMock(
+            return_value={
+                "bids": [{"price": "0.48", "size": "100"}],
+                "asks": [{"price": "0.52", "size": "12345678901.123456"}],
+            }
+        )
+
+        book = await connector.get_orderbook("token-1")
+        connector._request.assert_awaited_once_with("GET", "/book", params={"token_id": "token-1"})
+        assert str(book.bids[0].price) == "0.48"
+        # Sizes are not limited to the 12-digit price context
+        assert book.asks[0].quantity == Decimal("12345678901.123456")
+
+    @pytest.mark.asyncio
+    async def test_get_orderbook_arrays(self):
+        pytest.importorskip("numpy")
+        connector = PolymarketConnector()
+        connector._request = AsyncMock(
+            return_value={
+                "bids": [{"price": "0.48", "size": "100"}, {"price": "0.47", "size": "5"}],
+                "asks": [],
+            }
+        )
+
+        book = await connector.get_orderbook_arrays("token-1")
+        assert book.bid_prices.tolist() == [0.48, 0.47]
+        assert book.bid_sizes.sum() == 105.0
+        assert book.ask_prices.size == 0
+
+    @pytest.mark.asyncio
+    async def test_place_order(self):
+        connector = PolymarketConnector()
+        connector._client = MagicMock()
+        connector._request = AsyncMock(return_value={"orderID": "0xabc", "success": True})
+
+        order = await connector.place_order("token-1", OrderSide.BUY, OrderType.LIMIT, "10", "0.45")
+        assert order.order_id == "0xabc"
+        assert order.price == Decimal("0.45")
+        assert order.status == OrderStatus.OPEN
+        assert order.filled_quantity == Decimal(0)
+        assert order.created_at is not None
+        assert connector._request.await_args.args[:2] == ("POST", "/order")
+
+    @pytest.mark.asyncio
+    async def test_get_order(self):
+        connector = PolymarketConnector()
+        result = {
+            "id": "o1",
+            "asset_id": "t",
+            "side": "SELL",
+            "original_size": "5",
+            "price": "0.52",
+            "size_matched": "2",
+            "status": "matched",
+        }
+        connector._request = AsyncMock(return_value=result)
+
+        order = await connector.get_order("o1")
+        assert order.side == OrderSide.SELL
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_quantity == Decimal("2")
+
+    @pytest.mark.asyncio
+    async def test_get_order_rejects_missing_asset_id(self):
+        connector = PolymarketConnector()
+        connector._request = AsyncMock(return_value={"id": "o1", "asset_id": None, "side": "BUY"})
+
+        with pytest.raises(ValidationError, match="symbol"):
+            await connector.get_order("o1")
+
+    @pytest.mark.asyncio
+    async def test_get_markets_cached_within_ttl(self):
+        connector = PolymarketConnector()
+        connector._request = AsyncMock(
+            return_value={"data": [{"condition_id": "c1", "question": "Q?"}]}
+        )
+
+        first = await connector.get_markets()
+        second = await connector.get_markets()
+        assert [m.symbol for m in second] == ["c1"]
+        assert second == first
+        connector._request.assert_awaited_once()
+
+        connector._markets_ttl = 0
+        await connector.get_markets()
+        assert connector._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_order_history_paginates(self):
+        connector = PolymarketConnector()
+        order = {
+            "id": "o1",
+            "asset_id": "t",
+            "side": "BUY",
+            "original_size": "5",
+            "price": "0.5",
+            "status": "live",
+        }
+        connector._request = AsyncMock(
+            side_effect=[
+                {"data": [order], "next_cursor": "Mg=="},
+                {"data": [dict(order, id="o2")], "next_cursor": "LTE="},
+            ]
+        )
+
+        orders = await connector.get_order_history()
+        assert [o.order_id for o in orders] == ["o1", "o2"]
+        assert connector._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        connector = PolymarketConnector()
+        connector._session = AsyncMock()
+        session = connector._session
+
+        await connector.close()
+        session.close.assert_awaited_once()
+        assert connector._session is None
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_injected_session_open(self):
+        session = AsyncMock()
+        connector = PolymarketConnector(session=session)
+
+        await connector.close()
+        session.close.assert_not_called()
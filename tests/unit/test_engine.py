@@ -0,0 +1,183 @@
+"""Tests for the trading engine."""
+
+import asyncio
+import itertools
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tradingbot.config.settings import AppSettings
+from tradingbot.core.base import BaseConnector
+from tradingbot.core.engine import TradingEngine, engine_context
+from tradingbot.core.exceptions import ConnectorError, OrderError
+from tradingbot.core.models import OrderSide, Signal
+
+
+@pytest.fixture
+def engine(mock_connector):
+    eng = TradingEngine(AppSettings())
+    eng.connectors[mock_connector.name] = mock_connector
+    return eng
+
+
+class TestAggregation:
+    @pytest.mark.asyncio
+    async def test_get_all_balances(self, engine):
+        balances = await engine.get_all_balances()
+        assert list(balances) == ["mock_exchange"]
+        assert balances["mock_exchange"][0].currency == "USD"
+
+    @pytest.mark.asyncio
+    async def test_connector_error_yields_empty_list(self, engine, mock_connector):
+        failing = AsyncMock()
+        failing.name = "failing"
+        failing.get_positions = AsyncMock(side_effect=ConnectorError("failing", "down"))
+        engine.connectors["failing"] = failing
+
+        positions = await engine.get_all_positions()
+        assert positions == {"mock_exchange": [], "failing": []}
+        mock_connector.get_positions.assert_awaited_once()
+
+
+class TestStrategyLoop:
+    @pytest.fixture
+    def strategy(self):
+        signals = [
+            Signal(
+                strategy_name="stub",
+                connector_name="mock_exchange",
+                symbol="BTC/USD",
+                side=OrderSide.BUY,
+                quantity=Decimal("1"),
+            ),
+            Signal(
+                strategy_name="stub",
+                connector_name="mock_exchange",
+                symbol="ETH/USD",
+                side=OrderSide.SELL,
+                quantity=Decimal("2"),
+            ),
+        ]
+        strat = MagicMock()
+        strat.name = "stub"
+        strat.tick_interval = 0.01
+        strat.evaluate = AsyncMock(return_value=signals)
+        return strat
+
+    @pytest.mark.asyncio
+    async def test_ticks_on_strategy_interval(self, engine, strategy):
+        engine.settings = AppSettings(dry_run=True)
+        engine._running = True
+        task = asyncio.create_task(engine._strategy_loop(strategy))
+        await asyncio.sleep(0.1)
+        engine._running = False
+        await task
+        assert strategy.evaluate.await_count >= 3
+
+    @pytest.mark.asyncio
+    async def test_backoff_never_shorter_than_long_interval(self, engine, strategy):
+        strategy.tick_interval = 120.0
+        strategy.evaluate = AsyncMock(side_effect=RuntimeError("boom"))
+        engine._running = True
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 3:
+                engine._running = False
+
+        with patch("tradingbot.core.engine.asyncio.sleep", fake_sleep):
+            await engine._strategy_loop(strategy)
+        # Time is frozen, so each sleep is the running total of scheduled delays
+        gaps = [b - a for a, b in itertools.pairwise(sleeps)]
+        assert sleeps[0] == pytest.approx(120.0, abs=1.0)
+        assert all(gap >= 119.0 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_failed_order_does_not_block_others(self, engine, mock_connector, strategy):
+        engine.settings = AppSettings(dry_run=False)
+        mock_connector.place_order = AsyncMock(side_effect=[OrderError("rejected"), None])
+
+        await engine._execute_signals(await strategy.evaluate())
+        assert mock_connector.place_order.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_routes_to_strategy_default(self, engine, mock_connector):
+        engine.settings = AppSettings(dry_run=False)
+        other = AsyncMock()
+        engine.connectors["other"] = other
+        signals = [
+            Signal(strategy_name="stub", symbol="A", side=OrderSide.BUY, quantity=Decimal("1")),
+            Signal(
+                strategy_name="stub",
+                connector_name="other",
+                symbol="B",
+                side=OrderSide.BUY,
+                quantity=Decimal("1"),
+            ),
+            Signal(
+                strategy_name="stub",
+                connector_name="missing",
+                symbol="C",
+                side=OrderSide.BUY,
+                quantity=Decimal("1"),
+            ),
+        ]
+
+        await engine._execute_signals(signals, default=mock_connector)
+        assert mock_connector.place_order.await_args.kwargs["symbol"] == "A"
+        assert other.place_order.await_args.kwargs["symbol"] == "B"
+
+    @pytest.mark.asyncio
+    async def test_places_orders_on_fake_connector(self, fake_connector):
+        assert isinstance(fake_connector, BaseConnector)
+        eng = TradingEngine(AppSettings(dry_run=False))
+        eng.connectors[fake_connector.name] = fake_connector
+        signals = [
+            Signal(strategy_name="stub", symbol=symbol, side=OrderSide.BUY, quantity=Decimal("1"))
+            for symbol in ("BTC/USD", "ETH/USD")
+        ]
+
+        await eng._execute_signals(signals, default=fake_connector)
+        assert [o.symbol for o in fake_connector.placed] == ["BTC/USD", "ETH/USD"]
+
+
+class TestEngineContext:
+    @pytest.fixture
+    def settings(self, monkeypatch):
+        for key in ["CCXT_API_KEY", "ALPACA_API_KEY", "POLYMARKET_PRIVATE_KEY"]:
+            monkeypatch.delenv(key, raising=False)
+        return AppSettings()
+
+    @pytest.mark.asyncio
+    async def test_nested_users_share_engine(self, settings, mock_connector):
+        async with engine_context(settings) as outer:
+            outer.connectors[mock_connector.name] = mock_connector
+            async with engine_context(settings) as inner:
+                assert inner is outer
+            mock_connector.close.assert_not_awaited()
+        mock_connector.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_new_engine_after_exit(self, settings):
+        async with engine_context(settings) as first:
+            pass
+        async with engine_context(settings) as second:
+            assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_rejects_different_settings(self, settings):
+        async with engine_context(settings) as engine:
+            async with engine_context() as same:
+                assert same is engine
+            with pytest.raises(ValueError, match="different settings"):
+                async with engine_context(AppSettings(dry_run=not settings.dry_run)):
+                    pass
+
+    def test_engine_per_event_loop(self, settings):
+        async def enter():
+            async with engine_context(settings) as engine:
+                return engine
+
+        assert asyncio.run(enter()) is not asyncio.run(enter())
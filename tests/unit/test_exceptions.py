@@ -0,0 +1,48 @@
+"""Tests for custom exceptions."""
+
+import pickle
+
+from tradingbot.core.exceptions import ConnectorError, OrderError
+
+
+class TestConnectorError:
+    def test_formats_lazily(self):
+        err = ConnectorError("polymarket", "Failed ticker for %s: %s", "tok", ValueError("boom"))
+        assert err.connector_name == "polymarket"
+        assert str(err) == "[polymarket] Failed ticker for tok: boom"
+
+    def test_args_hold_formatted_message(self):
+        err = ConnectorError("ccxt", "Failed: %s", "timeout")
+        assert err.args == ("[ccxt] Failed: timeout",)
+        assert repr(err) == "ConnectorError('[ccxt] Failed: timeout')"
+
+    def test_plain_message_keeps_percent(self):
+        assert str(ConnectorError("ccxt", "100% down")) == "[ccxt] 100% down"
+
+    def test_pickle_round_trip(self):
+        err = pickle.loads(pickle.dumps(ConnectorError("ccxt", "Failed: %s", "timeout")))
+        assert err.connector_name == "ccxt"
+        assert str(err) == "[ccxt] Failed: timeout"
+
+
+class TestOrderError:
+    def test_formats_lazily(self):
+        err = OrderError("Failed to cancel order %s: %s", "o1", "gone", order_id="o1")
+        assert err.order_id == "o1"
+        assert str(err) == "Failed to cancel order o1: gone"
+        assert err.args == ("Failed to cancel order o1: gone",)
+
+    def test_order_id_is_keyword_only(self):
+        assert OrderError("Order rejected", order_id="o2").order_id == "o2"
+        err = OrderError("Order %s rejected", "o1")
+        assert err.order_id is None
+        assert str(err) == "Order o1 rejected"
+
+    def test_plain_message_keeps_percent(self):
+        assert str(OrderError("100% filled")) == "100% filled"
+
+    def test_pickle_keeps_order_id(self):
+        err = OrderError("Failed %s: %s", "o1", "timeout", order_id="o1")
+        err = pickle.loads(pickle.dumps(err))
+        assert err.order_id == "o1"
+        assert str(err) == "Failed o1: timeout"
@@ -1,22 +1,26 @@
 """Tests for core data models."""
 
+import math
 from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
 
 from tradingbot.core.models import (
+    ORDER_SIDE_BY_VALUE,
+    ORDER_STATUS_BY_VALUE,
     Balance,
     Market,
     Order,
     OrderBook,
+    OrderBookArrays,
     OrderBookEntry,
     OrderSide,
     OrderStatus,
     OrderType,
-    Position,
     Signal,
     Ticker,
+    construct_trusted,
 )
 
 
@@ -34,6 +38,13 @@ class TestEnums:
         assert OrderStatus.CANCELLED == "cancelled"
 
 
+class TestEnumTables:
+    def test_tables_match_enum_lookup(self):
+        assert ORDER_SIDE_BY_VALUE["buy"] is OrderSide("buy")
+        assert ORDER_STATUS_BY_VALUE["partially_filled"] is OrderStatus.PARTIALLY_FILLED
+        assert set(ORDER_STATUS_BY_VALUE.values()) == set(OrderStatus)
+
+
 class TestBalance:
     def test_create(self, sample_balance):
         assert sample_balance.currency == "BTC"
@@ -50,6 +61,10 @@ class TestBalance:
         b = Balance(currency="BTC", free=Decimal("0.00000001"), total=Decimal("0.00000001"))
         assert b.free == Decimal("0.00000001")
 
+    def test_frozen(self, sample_balance):
+        with pytest.raises(ValidationError):
+            sample_balance.free = Decimal("0")
+
 
 class TestPosition:
     def test_create(self, sample_position):
@@ -62,6 +77,15 @@ class TestPosition:
         assert data["symbol"] == "BTC/USDT"
         assert data["side"] == "buy"
 
+    def test_float_views(self, sample_position):
+        assert sample_position.unrealized_pnl_f == 2500.0
+        assert isinstance(sample_position.quantity_f, float)
+        assert "quantity_f" not in sample_position.model_dump()
+
+    def test_float_views_reset_on_copy(self, sample_position):
+        assert sample_position.quantity_f != 7.0
+        assert sample_position.model_copy(update={"quantity": Decimal("7")}).quantity_f == 7.0
+
 
 class TestOrder:
     def test_create(self, sample_order):
@@ -69,6 +93,35 @@ class TestOrder:
         assert sample_order.status == OrderStatus.PARTIALLY_FILLED
         assert sample_order.filled_quantity == Decimal("0.25")
 
+    def test_construct_trusted_matches_validated(self, sample_order):
+        fields = {name: getattr(sample_order, name) for name in Order.model_fields}
+        built = construct_trusted(Order, **fields)
+        assert built == sample_order
+        assert built.model_dump(mode="json") == sample_order.model_dump(mode="json")
+        assert built.model_copy(update={"order_id": "y"}).order_id == "y"
+        with pytest.raises(ValidationError):
+            built.order_id = "z"
+
+    def test_construct_trusted_rejects_missing_fields(self):
+        with pytest.raises(ValueError, match="missing fields: created_at, raw_data"):
+            construct_trusted(
+                Order,
+                order_id="x",
+                symbol="X/Y",
+                side=OrderSide.BUY,
+                type=OrderType.MARKET,
+                quantity=Decimal("1"),
+                price=None,
+                filled_quantity=Decimal(0),
+                status=OrderStatus.OPEN,
+                connector_name="",
+            )
+
+    def test_construct_trusted_rejects_unknown_fields(self, sample_order):
+        fields = {name: getattr(sample_order, name) for name in Order.model_fields}
+        with pytest.raises(ValueError, match="unknown fields: fee"):
+            construct_trusted(Order, **fields, fee=Decimal("0.1"))
+
     def test_defaults(self):
         o = Order(
             order_id="x",
@@ -88,6 +141,12 @@ class TestOrder:
         assert restored.order_id == sample_order.order_id
         assert restored.quantity == sample_order.quantity
 
+    def test_ignores_unknown_payload_keys_and_is_hashable(self, sample_order):
+        data = sample_order.model_dump() | {"clientOrderId": "abc"}
+        restored = Order.model_validate(data | {"raw_data": None})
+        assert not hasattr(restored, "clientOrderId")
+        assert hash(restored) == hash(Order.model_validate(data | {"raw_data": None}))
+
 
 class TestMarket:
     def test_create(self, sample_market):
@@ -99,6 +158,10 @@ class TestMarket:
         assert m.min_order_size == Decimal(0)
         assert m.precision == 8
 
+    def test_frozen(self, sample_market):
+        with pytest.raises(ValidationError):
+            sample_market.active = False
+
 
 class TestTicker:
     def test_create(self, sample_ticker):
@@ -109,6 +172,15 @@ class TestTicker:
         assert t.bid is None
         assert t.ask is None
 
+    def test_float_views(self, sample_ticker):
+        assert sample_ticker.bid_f == 54990.0
+        assert math.isnan(Ticker(symbol="X/Y").ask_f)
+
+    def test_float_views_reset_on_copy(self):
+        ticker = Ticker(symbol="X/Y", bid=Decimal("1"))
+        assert ticker.bid_f == 1.0
+        assert ticker.model_copy(update={"bid": Decimal("2")}).bid_f == 2.0
+
 
 class TestOrderBook:
     def test_create(self, sample_orderbook):
@@ -120,6 +192,44 @@ class TestOrderBook:
         assert ob.bids == []
         assert ob.asks == []
 
+    def test_as_arrays(self, sample_orderbook):
+        np = pytest.importorskip("numpy")
+        bid_px, _bid_sz, _ask_px, ask_sz = sample_orderbook.as_arrays()
+        assert bid_px.dtype == np.float64
+        assert bid_px.tolist() == [54990.0]
+        assert ask_sz.tolist() == [2.0]
+        assert sample_orderbook.bid_prices is bid_px
+        assert OrderBook(symbol="X/Y").ask_prices.size == 0
+
+    def test_model_copy_recomputes_arrays(self, sample_orderbook):
+        pytest.importorskip("numpy")
+        assert sample_orderbook.bid_prices.tolist() == [54990.0]
+        bids = [OrderBookEntry(price=Decimal("54980"), quantity=Decimal("3"))]
+        updated = sample_orderbook.model_copy(update={"bids": bids})
+        assert updated.bid_prices.tolist() == [54980.0]
+        assert updated.bid_sizes.tolist() == [3.0]
+        assert updated.ask_prices.tolist() == sample_orderbook.ask_prices.tolist()
+
+    def test_to_arrays_matches_from_levels(self, sample_orderbook):
+        pytest.importorskip("numpy")
+        arrays = sample_orderbook.to_arrays()
+        built = OrderBookArrays.from_levels("BTC/USDT", [[54990, 1.5]], [[55010, 2.0]])
+        assert arrays.symbol == sample_orderbook.symbol
+        assert arrays.bid_prices.tolist() == built.bid_prices.tolist()
+        assert arrays.ask_sizes.tolist() == built.ask_sizes.tolist()
+        assert OrderBookArrays.from_levels("X/Y", [], []).bid_prices.size == 0
+
+    def test_entry_to_ticks(self):
+        entry = OrderBookEntry(price=Decimal("0.47"), quantity=Decimal("120.5"))
+        assert entry.to_ticks(2, 1) == (47, 1205)
+
+    def test_entries_are_immutable(self, sample_orderbook):
+        with pytest.raises(AttributeError):
+            sample_orderbook.bids[0].price = Decimal("1")
+        assert sample_orderbook.model_dump(mode="json")["bids"] == [
+            {"price": "54990", "quantity": "1.5"}
+        ]
+
 
 class TestSignal:
     def test_create(self):
@@ -134,7 +244,7 @@ class TestSignal:
         assert s.order_type == OrderType.MARKET
 
     def test_confidence_bounds(self):
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="less than or equal to 1"):
             Signal(
                 strategy_name="x",
                 symbol="X/Y",
@@ -144,7 +254,7 @@ class TestSignal:
             )
 
     def test_confidence_negative_rejected(self):
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
             Signal(
                 strategy_name="x",
                 symbol="X/Y",
@@ -0,0 +1,105 @@
+"""Tests for utility helpers."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from tradingbot.utils.async_helpers import (
+    _default_workers,
+    close_shared_session,
+    get_shared_session,
+    signing_worker,
+)
+from tradingbot.utils.decimal_helpers import ZERO, from_ticks, to_decimal, to_ticks
+from tradingbot.utils.runner import run
+
+
+class TestToDecimal:
+    def test_float_uses_shortest_repr(self):
+        assert str(to_decimal(0.1)) == "0.1"
+
+    def test_string_and_int(self):
+        assert to_decimal("0.00000001") == Decimal("0.00000001")
+        assert to_decimal(5) == Decimal(5)
+
+    def test_missing_values_are_zero(self):
+        for value in (None, "", 0, 0.0, "0"):
+            assert to_decimal(value) is ZERO
+
+    def test_float_conversions_are_cached(self):
+        assert to_decimal(54990.5) is to_decimal(54990.5)
+        assert to_decimal(54990.5) == Decimal("54990.5")
+
+    def test_decimal_passthrough(self):
+        d = Decimal("1.5")
+        assert to_decimal(d) is d
+
+
+class TestTicks:
+    def test_round_trip(self):
+        assert to_ticks(Decimal("0.53"), 2) == 53
+        assert from_ticks(53, 2) == Decimal("0.53")
+        assert to_ticks(Decimal("1500"), 0) == 1500
+
+    def test_finer_digits_round_half_even(self):
+        assert to_ticks(Decimal("0.125"), 2) == 12
+        assert to_ticks(Decimal("0.135"), 2) == 14
+
+
+class TestSharedSession:
+    @pytest.mark.asyncio
+    async def test_reused_until_closed(self):
+        first = await get_shared_session()
+        assert await get_shared_session() is first
+
+        await close_shared_session()
+        assert first.closed
+        second = await get_shared_session()
+        assert second is not first
+        await close_shared_session()
+
+    def test_stale_session_closed_on_new_loop(self):
+        first = asyncio.run(get_shared_session())
+        second = asyncio.run(get_shared_session())
+        assert second is not first
+        assert first.closed
+        asyncio.run(close_shared_session())
+
+
+class TestSigningWorker:
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        assert await signing_worker.submit(lambda a, b=0: a + b, 2, b=3) == 5
+
+    @pytest.mark.asyncio
+    async def test_propagates_exception(self):
+        def boom():
+            raise ValueError("bad order")
+
+        with pytest.raises(ValueError, match="bad order"):
+            await signing_worker.submit(boom)
+
+
+class TestExecutorWorkers:
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("TRADINGBOT_EXECUTOR_WORKERS", "12")
+        assert _default_workers() == 12
+
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("TRADINGBOT_EXECUTOR_WORKERS", raising=False)
+        assert 5 <= _default_workers() <= 32
+
+    @pytest.mark.parametrize("value", ["many", "0", "-3", "2.5"])
+    def test_invalid_value_falls_back(self, monkeypatch, caplog, value):
+        monkeypatch.setenv("TRADINGBOT_EXECUTOR_WORKERS", value)
+        assert 5 <= _default_workers() <= 32
+        assert "TRADINGBOT_EXECUTOR_WORKERS" in caplog.text
+
+
+class TestRunner:
+    def test_run_returns_result(self):
+        async def answer():
+            return 42
+
+        assert run(answer()) == 42
@@ -0,0 +1,45 @@
+"""Tests for the web dashboard."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tradingbot.web.app import _SnapshotBroadcaster
+
+
+@pytest.fixture
+def engine():
+    eng = MagicMock()
+    eng.get_all_balances = AsyncMock(return_value={})
+    eng.get_all_positions = AsyncMock(return_value={})
+    eng.is_running = True
+    eng.connected_exchanges = []
+    return eng
+
+
+class TestSnapshotBroadcaster:
+    @pytest.mark.asyncio
+    async def test_late_client_gets_current_snapshot(self, engine):
+        broadcaster = _SnapshotBroadcaster(engine, interval=60)
+        first = await broadcaster.wait(broadcaster.subscribe())
+
+        after = broadcaster.subscribe()
+        assert await asyncio.wait_for(broadcaster.wait(after), 1) == first
+        assert '"running":true' in broadcaster.message
+        broadcaster.unsubscribe()
+        broadcaster.unsubscribe()
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_waits_for_fresh_snapshot(self, engine):
+        broadcaster = _SnapshotBroadcaster(engine, interval=60)
+        first = await broadcaster.wait(broadcaster.subscribe())
+        broadcaster.unsubscribe()
+        assert broadcaster.message == ""
+
+        engine.is_running = False
+        after = broadcaster.subscribe()
+        assert after == first
+        assert await asyncio.wait_for(broadcaster.wait(after), 1) > first
+        assert '"running":false' in broadcaster.message
+        broadcaster.unsubscribe()